@@ -1 +1,4 @@
+# -*- coding: utf-8 -*-
 __version__ = '0.1.0'
+
+default_app_config = 'django_dynamic_views.apps.DynamicViewsConfig'
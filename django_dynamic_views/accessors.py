@@ -0,0 +1,133 @@
+import inspect
+
+from django.conf import settings
+from django.db.models import Model
+from django.db.models.fields.related import ForeignObjectRel
+
+from .query import get_model_field, split_path
+
+_accessors = {}
+
+
+def string_if_invalid():
+    return getattr(settings, 'TEMPLATE_STRING_IF_INVALID', '')
+
+
+class Invalid(Exception):
+    pass
+
+
+def generic_step(name):
+    """
+    Step that looks up name the way the get_attribute filter does:
+    dict key, attribute or index, calling the result when it is callable.
+    """
+    index = int(name) if name.isdigit() else None
+
+    def step(value):
+        if hasattr(value, '__iter__') and name in value:
+            value = value[name]
+        elif hasattr(value, name):
+            value = getattr(value, name)
+        elif index is not None and len(value) > index:
+            value = value[index]
+        else:
+            raise Invalid()
+
+        if callable(value):
+            value = value()
+        return value
+
+    return step
+
+
+def attribute_step(name, call=None):
+    """
+    Step that gets an attribute. When call is None it is only called when it is callable at runtime.
+    """
+    def step(value):
+        try:
+            value = getattr(value, name)
+        except AttributeError:
+            raise Invalid()
+
+        if call or (call is None and callable(value)):
+            value = value()
+        return value
+
+    return step
+
+
+def compile_step(model, name):
+    """
+    Compiles one part of a path. When the model class is known, the kind of lookup
+    is decided here instead of for every cell.
+
+    :param model: model class of the value or None when unknown
+    :param name: path part
+    :return: tuple (step, model class of the result or None)
+    """
+    if model is None or not issubclass(model, Model) or hasattr(model, '__iter__'):
+        return generic_step(name), None
+
+    field = get_model_field(model, name)
+    if field is not None and not (field.is_relation and field.related_model is None):
+        if not field.is_relation:
+            return attribute_step(field.attname, call=False), None
+
+        if isinstance(field, ForeignObjectRel):
+            name = field.get_accessor_name()
+
+        if field.many_to_many or field.one_to_many:
+            # A related manager, which is callable but shouldn't be called
+            return attribute_step(name, call=False), None
+
+        return attribute_step(name, call=False), field.related_model
+
+    attribute = getattr(model, name, None)
+    if inspect.isfunction(attribute) or inspect.ismethod(attribute):
+        return attribute_step(name, call=True), None
+
+    if hasattr(model, name):
+        return attribute_step(name), None
+
+    # Could be set on the instance only
+    return generic_step(name), None
+
+
+class Accessor(object):
+    """
+    A field path (e.g. author__name) compiled into a chain of lookup steps
+    """
+
+    def __init__(self, model, path):
+        self.model = model
+        self.path = path
+        self.steps = []
+
+        for name in split_path(path):
+            step, model = compile_step(model, name)
+            self.steps.append(step)
+
+    def __call__(self, value):
+        try:
+            for step in self.steps:
+                value = step(value)
+        except Invalid:
+            return string_if_invalid()
+        return value
+
+
+def get_accessor(model, path):
+    """
+    Returns the compiled accessor of a path, cached per class so it survives across requests
+
+    :param model: class of the objects the path is looked up on
+    :param path: field path
+    :return: Accessor
+    """
+    key = (model, path)
+    accessor = _accessors.get(key)
+    if accessor is None:
+        accessor = _accessors[key] = Accessor(model, path)
+    return accessor
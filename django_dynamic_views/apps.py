@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+from django.core import checks
+
+
+class DynamicViewsConfig(AppConfig):
+    name = 'django_dynamic_views'
+    verbose_name = 'Dynamic views'
+
+    def ready(self):
+        from .cache import watch_setting_models
+        from .checks import check_dynamic_views
+
+        watch_setting_models()
+
+        checks.register(check_dynamic_views)
@@ -0,0 +1,171 @@
+import hashlib
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import signals
+from django.utils import six
+from django.utils.encoding import force_bytes
+
+VERSION_KEY = 'django_dynamic_views.version.{}.{}'
+
+_watched_models = set()
+
+
+def get_cache():
+    """
+    Returns the cache used for the model versions and the cached lists,
+    set with the DYNAMIC_VIEWS_CACHE setting
+    """
+    return caches[getattr(settings, 'DYNAMIC_VIEWS_CACHE', 'default')]
+
+
+def get_version_key(model):
+    opts = model._meta
+    return VERSION_KEY.format(opts.app_label, opts.model_name)
+
+
+def new_version():
+    """
+    A new version is based on the time, so a version that was evicted from the cache
+    never gets a number that was used before
+    """
+    return int(time.time() * 1000)
+
+
+def get_model_versions(models):
+    """
+    Returns the current version of the models, which changes whenever an instance is
+    saved or deleted
+
+    :param models: model classes
+    :return: list of versions, in the order of the models
+    """
+    cache = get_cache()
+    keys = [get_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_version(), None)
+            versions[key] = cache.get(key)
+
+    return [versions[key] for key in keys]
+
+
+def bump_model_version(model):
+    """
+    Invalidates everything that is cached for the model
+
+    :param model: model class
+    """
+    cache = get_cache()
+    key = get_version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, new_version(), None)
+
+
+def model_changed(sender, **kwargs):
+    """
+    Receiver of post_save and post_delete
+    """
+    bump_model_version(sender)
+
+
+def m2m_changed(sender, instance, model, **kwargs):
+    """
+    Receiver of m2m_changed, both sides of the relation change
+    """
+    bump_model_version(sender)
+    bump_model_version(instance.__class__)
+    bump_model_version(model)
+
+
+def get_through_models(model):
+    """
+    Returns the intermediate models of the many-to-many relations of the model, in both directions
+    """
+    through_models = []
+    for field in model._meta.get_fields(include_hidden=True):
+        if field.many_to_many:
+            through = getattr(field, 'through', None) or field.remote_field.through
+            if through and not isinstance(through, six.string_types):
+                through_models.append(through)
+    return through_models
+
+
+def watch_models(models):
+    """
+    Connects the receivers that change the version of the models when they are saved or deleted.
+    Only the models of cached lists are watched, the other models keep their fast deletes and
+    saves without cache updates.
+
+    :param models: model classes
+    """
+    for model in models:
+        if model in _watched_models:
+            continue
+
+        uid = get_version_key(model)
+        signals.post_save.connect(model_changed, sender=model, dispatch_uid=uid)
+        signals.post_delete.connect(model_changed, sender=model, dispatch_uid=uid)
+        for through in get_through_models(model):
+            signals.m2m_changed.connect(m2m_changed, sender=through, dispatch_uid=get_version_key(through))
+
+        _watched_models.add(model)
+
+
+def get_cached_models():
+    """
+    Returns the models of the DYNAMIC_VIEWS_CACHED_MODELS setting ('app_label.Model' strings): every
+    model that is shown in a cached list
+
+    :return: list of model classes
+    """
+    return [apps.get_model(label) for label in getattr(settings, 'DYNAMIC_VIEWS_CACHED_MODELS', [])]
+
+
+def watch_setting_models():
+    """
+    Watches the models of the DYNAMIC_VIEWS_CACHED_MODELS setting when the app is ready, so every
+    process that changes them (web workers, task workers, management commands) invalidates the cached
+    lists, also when it never renders one
+    """
+    watch_models(get_cached_models())
+
+
+def make_key(prefix, *parts):
+    """
+    Builds a cache key from the hashable parts
+
+    :param prefix: key prefix
+    :return: string cache key
+    """
+    return '{}.{}'.format(prefix, hashlib.md5(force_bytes(repr(parts))).hexdigest())
+
+
+class FragmentCache(object):
+    """
+    Rendered fragments of a list page. The keys are given per fragment name,
+    the cached fragments are retrieved with one get_many.
+    """
+
+    def __init__(self, keys, timeout=None):
+        self.keys = keys
+        self.timeout = timeout
+        cached = get_cache().get_many(list(keys.values()))
+        self.fragments = {name: cached[key] for name, key in keys.items() if key in cached}
+
+    def has(self, name):
+        return name in self.fragments
+
+    def get(self, name):
+        return self.fragments.get(name)
+
+    def set(self, name, output):
+        if name in self.keys:
+            get_cache().set(self.keys[name], output, self.timeout)
+            self.fragments[name] = output
@@ -0,0 +1,177 @@
+from django.conf import settings
+from django.core import checks
+from django.core.urlresolvers import get_resolver
+
+from .cache import get_cached_models
+from .query import FieldPath
+from .registry import registry
+
+
+def get_subclasses(cls):
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(get_subclasses(subclass))
+    return subclasses
+
+
+def get_list_views():
+    """
+    Returns the list views to check: the lists of the registered DynamicCRUDView classes
+    and the DynamicListView subclasses with a model or queryset
+
+    :return: list of (label, view instance) tuples
+    """
+    from .views import DynamicListView
+
+    if getattr(settings, 'ROOT_URLCONF', None):
+        # The DynamicCRUDView classes are registered when the url configuration is imported
+        try:
+            get_resolver().url_patterns
+        except Exception:
+            # Reported by the url checks
+            pass
+
+    views = []
+    for crud_class in registry:
+        try:
+            view_configs = crud_class().get_view_configs()
+        except Exception:
+            # Reported by get_crud_errors
+            continue
+        for config in view_configs.values():
+            view_class = getattr(config.view, 'view_class', None)
+            if view_class and issubclass(view_class, DynamicListView):
+                label = '{}.{}.{}'.format(crud_class.__module__, crud_class.__name__, config.link)
+                views.append((label, view_class(**config.view.view_initkwargs)))
+
+    for view_class in get_subclasses(DynamicListView):
+        if view_class.model is not None or view_class.queryset is not None:
+            views.append(('{}.{}'.format(view_class.__module__, view_class.__name__), view_class()))
+
+    return views
+
+
+def get_crud_errors(app_configs=None):
+    """
+    Builds the views of the registered DynamicCRUDView classes, a wrong view kwarg is reported
+    at startup instead of on the first request
+
+    :param app_configs: app configs to check, None for every app
+    :return: list of check messages
+    """
+    errors = []
+    for crud_class in registry:
+        if app_configs is not None and crud_class.model._meta.app_config not in app_configs:
+            continue
+        try:
+            crud_class().get_view_configs()
+        except Exception as e:
+            errors.append(checks.Error(
+                "The views can't be built: {!r}".format(e),
+                obj='{}.{}'.format(crud_class.__module__, crud_class.__name__), id='django_dynamic_views.E004',
+            ))
+    return errors
+
+
+def get_path_errors(label, view):
+    """
+    Resolves the field names, search fields, filter fields and order fields of a list view
+    against the model _meta
+
+    :param label: name of the view in the messages
+    :param view: DynamicListView instance
+    :return: list of check messages
+    """
+    model = view.get_queryset_model()
+    annotations = list(view.annotate_fields or {})
+    errors = []
+
+    for path in view.get_field_names():
+        field_path = FieldPath(model, path)
+        if field_path.kind == FieldPath.ATTRIBUTE and not (
+                hasattr(field_path.target_model, field_path.name) or
+                (not field_path.joins and field_path.name in annotations)):
+            errors.append(checks.Error(
+                "'{}' in field_names is not a field or attribute of {}.".format(path, model._meta.label),
+                obj=label, id='django_dynamic_views.E001',
+            ))
+
+    lookups = [('search_fields', path) for path in view.get_search_backend().search_paths(
+        view.get_search_fields() or [])]
+    lookups += [('filter_fields', path) for filter_field in view.get_filter_fields() for path in filter_field]
+    lookups += [('order_fields', path) for path in view.get_order_fields()]
+
+    for attribute, path in lookups:
+        field_path = FieldPath(model, path)
+        if field_path.kind == FieldPath.ATTRIBUTE and not (not field_path.joins and field_path.name in annotations):
+            errors.append(checks.Error(
+                "'{}' in {} is not a field of {}, it can't be used in a query.".format(
+                    path, attribute, model._meta.label),
+                obj=label, id='django_dynamic_views.E002',
+            ))
+
+    return errors
+
+
+def get_cache_errors(label, view):
+    """
+    Reports the models of a cached list that are missing in the DYNAMIC_VIEWS_CACHED_MODELS setting,
+    their changes would not invalidate the list
+
+    :param label: name of the view in the messages
+    :param view: DynamicListView instance
+    :return: list of check messages
+    """
+    if not view.uses_model_versions():
+        return []
+
+    cached_models = get_cached_models()
+    return [
+        checks.Error(
+            "The list is cached but {} is not in the DYNAMIC_VIEWS_CACHED_MODELS setting.".format(model._meta.label),
+            hint='Add it, so saving or deleting an item invalidates the cached list in every process.',
+            obj=label, id='django_dynamic_views.E003',
+        )
+        for model in view.get_query_plan().models if model not in cached_models
+    ]
+
+
+def compile_view(view):
+    """
+    Resolves the query plan and compiles the field accessors of a list view, they are
+    cached for the following requests
+    """
+    view.get_query_plan()
+    view.get_field_accessors()
+
+
+def check_dynamic_views(app_configs=None, **kwargs):
+    """
+    System check that builds the views of the DynamicCRUDView classes, validates the field paths
+    of the dynamic list views and compiles them, so invalid paths are reported at startup instead
+    of when the list is rendered. Cached lists have to list their models in the
+    DYNAMIC_VIEWS_CACHED_MODELS setting.
+    """
+    views = get_list_views()
+    errors = get_crud_errors(app_configs)
+
+    for label, view in views:
+        try:
+            model = view.get_queryset_model()
+            if app_configs is not None and model._meta.app_config not in app_configs:
+                continue
+            view_errors = get_path_errors(label, view)
+            if not view_errors:
+                view_errors = get_cache_errors(label, view)
+                compile_view(view)
+        except Exception as e:
+            # e.g. a hook that needs the request
+            errors.append(checks.Warning(
+                "The field paths can't be checked: {!r}".format(e), obj=label, id='django_dynamic_views.W001',
+            ))
+            continue
+
+        errors.extend(view_errors)
+
+    return errors
@@ -0,0 +1,130 @@
+import json
+
+from django.core.cache import caches
+from django.db import connections
+
+from .cache import get_model_versions, make_key
+
+
+class ExactCount(object):
+    """
+    Counts the items of a list with SELECT COUNT(*), the default behaviour
+    """
+    uses_model_versions = False
+
+    def count(self, queryset, view):
+        """
+        Returns the number of items in the queryset
+
+        :param queryset: searched and filtered queryset of the list
+        :param view: list view
+        :return: tuple (count, estimated)
+        """
+        return queryset.count(), False
+
+
+class CachedCount(ExactCount):
+    """
+    Caches the exact count in Django's cache framework. The key is built from the model,
+    the view class, the normalized search and filter state and the versions of the models
+    of the list, so saving or deleting an item invalidates the count. The ordering and page
+    don't change the count.
+
+    The models have to be in the DYNAMIC_VIEWS_CACHED_MODELS setting. When the queryset of
+    the view differs per user, override get_cache_key.
+    """
+    uses_model_versions = True
+
+    def __init__(self, timeout=60, cache_alias='default', key_prefix='django_dynamic_views.count'):
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+
+    def get_cache_key(self, queryset, view):
+        """
+        Returns the cache key for the count of the queryset
+
+        :param queryset: searched and filtered queryset of the list
+        :param view: list view
+        :return: string cache key
+        """
+        opts = queryset.model._meta
+        return make_key(
+            self.key_prefix, opts.app_label, opts.model_name, view.__class__.__module__, view.__class__.__name__,
+            view.list_state.normalized(ordering=False, pagination=False),
+            tuple(get_model_versions(view.get_query_plan().models)),
+        )
+
+    def count(self, queryset, view):
+        cache = caches[self.cache_alias]
+        key = self.get_cache_key(queryset, view)
+
+        count = cache.get(key)
+        if count is None:
+            count = super(CachedCount, self).count(queryset, view)[0]
+            cache.set(key, count, self.timeout)
+
+        return count, False
+
+
+class EstimatedCount(ExactCount):
+    """
+    Uses the row estimate of the query planner instead of a COUNT when it is above the
+    threshold. Below the threshold, or when the database can't estimate, the exact count is used.
+
+    The estimate can be lower than the real count, the pages after the estimated last page
+    would not be found. So the exact count is used when the requested page reaches the
+    estimated last page (or is the 'last' page).
+
+    Only PostgreSQL (EXPLAIN) estimates are supported, override estimate for other databases.
+    """
+
+    def __init__(self, threshold=10000):
+        self.threshold = threshold
+
+    def estimate(self, queryset):
+        """
+        Returns the number of rows the query planner expects the queryset to return
+
+        :param queryset: queryset
+        :return: int or None when the database can't estimate
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) {}'.format(sql), params)
+            plan = cursor.fetchone()[0]
+
+        if not isinstance(plan, list):
+            plan = json.loads(plan)
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def is_near_end(self, estimate, queryset, view):
+        """
+        Determines if the requested page reaches the estimated last page, where the pages
+        after it have to be counted exactly
+
+        :param estimate: estimated number of items
+        :param queryset: searched and filtered queryset of the list
+        :param view: list view or None
+        :return: boolean
+        """
+        if view is None:
+            return False
+
+        page_number = view.get_page_number()
+        if page_number is None:
+            # 'last' or an invalid page
+            return True
+        return page_number * view.get_paginate_by(queryset) >= estimate
+
+    def count(self, queryset, view):
+        estimate = self.estimate(queryset)
+        if estimate is not None and estimate >= self.threshold and not self.is_near_end(estimate, queryset, view):
+            return estimate, True
+
+        return super(EstimatedCount, self).count(queryset, view)
@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+from django.db.models import CASCADE, Q
+from django.db.models.deletion import get_candidate_relations_to_delete
+
+
+class DeleteCounter(object):
+    """
+    Finds what deleting an object cascades to, without loading the related objects.
+
+    Instead of collecting every instance like the deletion Collector, the cascade is followed
+    with pk__in subqueries per model, so the rows can be counted with one COUNT per model and
+    only a sample of them has to be retrieved.
+
+    Only CASCADE relations and the parents and children of multi-table inheritance are followed,
+    generic relations are not counted. The parent link a model is reached through is not followed
+    back. max_depth limits the nesting of the subqueries, e.g. for self-referencing foreign keys,
+    deeper items are not counted.
+    """
+
+    def __init__(self, using, max_depth=10):
+        self.using = using
+        self.max_depth = max_depth
+
+    def get_base_queryset(self, model):
+        return model._base_manager.using(self.using)
+
+    def collect(self, obj):
+        """
+        Returns the querysets of the items that would be deleted with the object, per model
+
+        :param obj: model instance to delete
+        :return: OrderedDict with model -> queryset
+        """
+        querysets = OrderedDict()
+        # (model, queryset, depth, parent link the model is reached through)
+        pending = [(obj.__class__, self.get_base_queryset(obj.__class__).filter(pk=obj.pk), 0, None)]
+
+        while pending:
+            model, queryset, depth, via = pending.pop(0)
+            model = model._meta.concrete_model
+
+            if model in querysets:
+                querysets[model].append(queryset)
+            else:
+                querysets[model] = [queryset]
+
+            if depth >= self.max_depth:
+                continue
+
+            for ptr in model._meta.parents.values():
+                if ptr is None or ptr is via:
+                    continue
+                parent = ptr.remote_field.model
+                pending.append((parent, self.get_base_queryset(parent).filter(pk__in=queryset.values(ptr.attname)),
+                                depth + 1, ptr))
+
+            for related in get_candidate_relations_to_delete(model._meta):
+                field = related.field
+                if field.remote_field.on_delete != CASCADE or field is via:
+                    continue
+
+                pending.append((
+                    related.related_model,
+                    self.get_base_queryset(related.related_model).filter(
+                        **{'{}__in'.format(field.name): queryset.values(field.target_field.attname)}),
+                    depth + 1,
+                    field if field.remote_field.parent_link else None,
+                ))
+
+        return OrderedDict(
+            (model, self.combine(model, model_querysets)) for model, model_querysets in querysets.items()
+        )
+
+    def combine(self, model, querysets):
+        """
+        Combines the querysets of a model, so an item that is reached in more than one way is counted once
+        """
+        if len(querysets) == 1:
+            return querysets[0]
+
+        query = Q()
+        for queryset in querysets:
+            query |= Q(pk__in=queryset.values('pk'))
+        return self.get_base_queryset(model).filter(query)
+
+    def count(self, obj, sample_size=10):
+        """
+        Counts the items that would be deleted with the object per model, models without
+        items are left out
+
+        :param obj: model instance to delete
+        :param sample_size: maximum number of items retrieved per model
+        :return: list of (model, count, sample list) tuples
+        """
+        counts = []
+        for model, queryset in self.collect(obj).items():
+            count = queryset.count()
+            if count:
+                samples = list(queryset.order_by('pk')[:sample_size]) if sample_size else []
+                counts.append((model, count, samples))
+        return counts
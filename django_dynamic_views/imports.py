@@ -0,0 +1,156 @@
+import codecs
+import csv
+import json
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db.models import ForeignKey
+from django.utils import six
+from django.forms.models import fields_for_model
+from django.utils.encoding import force_text
+
+
+class ImportForm(forms.Form):
+    file = forms.FileField()
+    format = forms.ChoiceField(choices=(('csv', 'CSV'), ('jsonl', 'JSON Lines')), initial='csv')
+
+
+class ImportRowForm(forms.Form):
+    """
+    Base form of the rows of an import, with the form fields of the model fields (see
+    get_row_form_class). After the fields are cleaned the instance is built from every field and
+    validated by the model. The foreign keys are left out of the model validation, their form field
+    already looked them up, but they are part of the unique checks.
+    """
+    model = None
+
+    def get_validation_exclusions(self):
+        """
+        :return: names of the model fields that are not in the form
+        """
+        return [field.name for field in self.model._meta.fields if field.name not in self.fields]
+
+    def clean(self):
+        cleaned_data = super(ImportRowForm, self).clean()
+        if self.errors:
+            return cleaned_data
+
+        self.instance = self.model(**cleaned_data)
+        exclude = self.get_validation_exclusions()
+        foreign_keys = [name for name, field in self.fields.items() if isinstance(field, forms.ModelChoiceField)]
+
+        self.instance.full_clean(exclude=exclude + foreign_keys, validate_unique=False)
+        self.instance.validate_unique(exclude=exclude)
+        return cleaned_data
+
+
+def csv_reader(lines):
+    """
+    Returns a CSV reader for UTF-8 byte lines that yields rows of text. The csv module of
+    Python 2 only reads byte strings, there the cells are decoded after parsing.
+
+    :param lines: iterable of byte lines
+    :return: iterator of lists of text
+    """
+    lines = codecs.iterdecode(lines, 'utf-8-sig')
+    if six.PY3:
+        return csv.reader(lines)
+    return ([cell.decode('utf-8') for cell in row] for row in csv.reader(line.encode('utf-8') for line in lines))
+
+
+def read_csv_rows(lines, field_names, verbose_names=None):
+    """
+    Reads the rows of a CSV file, the first row is the header with the field names or their verbose names.
+    Columns that are not a field name are ignored.
+
+    :param lines: iterable of byte lines, e.g. an uploaded file
+    :param field_names: field names that can be imported
+    :param verbose_names: dict with field name -> verbose name
+    :return: generator of (line number, dict with field name -> value)
+    """
+    names = {force_text(verbose_name): field_name for field_name, verbose_name in (verbose_names or {}).items()
+             if field_name in field_names}
+    names.update((field_name, field_name) for field_name in field_names)
+
+    reader = csv_reader(lines)
+    header = [names.get(column.strip()) for column in next(reader, [])]
+
+    for line_number, values in enumerate(reader, 2):
+        if values:
+            yield line_number, {field_name: value for field_name, value in zip(header, values) if field_name}
+
+
+def read_jsonl_rows(lines, field_names):
+    """
+    Reads the rows of a JSON Lines file, one object with the field names as keys per line
+
+    :param lines: iterable of byte lines, e.g. an uploaded file
+    :param field_names: field names that can be imported
+    :return: generator of (line number, dict with field name -> value or None when the line is invalid)
+    """
+    for line_number, line in enumerate(codecs.iterdecode(lines, 'utf-8-sig'), 1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield line_number, None
+            continue
+        if not isinstance(data, dict):
+            yield line_number, None
+            continue
+        yield line_number, {field_name: value for field_name, value in data.items() if field_name in field_names}
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField that remembers the objects it looked up. The copies of the field in the forms
+    of one import share the lookups, so a foreign key value is queried once instead of once per row.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CachedModelChoiceField, self).__init__(*args, **kwargs)
+        self.lookups = {}
+
+    def __deepcopy__(self, memo):
+        result = super(CachedModelChoiceField, self).__deepcopy__(memo)
+        result.lookups = self.lookups
+        return result
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+
+        key = force_text(value)
+        if key not in self.lookups:
+            try:
+                self.lookups[key] = super(CachedModelChoiceField, self).to_python(value)
+            except ValidationError as e:
+                self.lookups[key] = e
+
+        result = self.lookups[key]
+        if isinstance(result, ValidationError):
+            raise result
+        return result
+
+
+def import_formfield(field, **kwargs):
+    """
+    formfield_callback for the import form fields, foreign keys get a CachedModelChoiceField
+    """
+    if isinstance(field, ForeignKey):
+        kwargs.setdefault('form_class', CachedModelChoiceField)
+    return field.formfield(**kwargs)
+
+
+def import_row_form_factory(model, fields):
+    """
+    Returns the ImportRowForm class of a model, with a form field per model field
+
+    :param model: model class
+    :param fields: names of the model fields
+    :return: ImportRowForm subclass
+    """
+    attrs = fields_for_model(model, fields=fields, formfield_callback=import_formfield)
+    attrs['model'] = model
+    return type(str('{}ImportRowForm'.format(model.__name__)), (ImportRowForm,), attrs)
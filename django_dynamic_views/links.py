@@ -0,0 +1,80 @@
+from django.core.urlresolvers import (
+    NoReverseMatch, RegexURLResolver, get_resolver, get_script_prefix, get_urlconf, reverse,
+)
+from django.utils.encoding import force_text
+from django.utils.http import RFC3986_SUBDELIMS, urlquote, urlunquote
+
+# Tried in order, the first one the url pattern accepts is used
+PLACEHOLDERS = ('dynamicviewspk', '918273645')
+
+
+def resolve_pattern(resolver, path):
+    """
+    Returns the url pattern a path resolves to, the way resolve() walks the included patterns
+
+    :param resolver: RegexURLResolver
+    :param path: path, starting with /
+    :return: (RegexURLPattern, the part of the path it matches) or (None, None)
+    """
+    match = resolver.regex.search(path)
+    if match:
+        path = path[match.end():]
+        for pattern in resolver.url_patterns:
+            if isinstance(pattern, RegexURLResolver):
+                sub_pattern, sub_path = resolve_pattern(pattern, path)
+                if sub_pattern is not None:
+                    return sub_pattern, sub_path
+            elif pattern.regex.search(path):
+                return pattern, path
+    return None, None
+
+
+class LinkPattern(object):
+    """
+    The url of a view with one (pk) argument, reversed once with a placeholder. The urls of
+    the objects are built by substituting the placeholder instead of reversing every url.
+
+    A pk is substituted only when the regex of the url pattern accepts it in place of the
+    placeholder, other pks (and every pk, when no placeholder matches) are reversed.
+    """
+
+    def __init__(self, viewname, current_app=None):
+        self.viewname = viewname
+        self.current_app = current_app
+        self.prefix = None
+        self.suffix = None
+        self.regex = None
+        self.path_prefix = None
+        self.path_suffix = None
+
+        for placeholder in PLACEHOLDERS:
+            try:
+                url = reverse(viewname, args=[placeholder], current_app=current_app)
+            except NoReverseMatch:
+                continue
+
+            if url.count(placeholder) != 1:
+                continue
+
+            path = urlunquote('/' + url[len(get_script_prefix()):])
+            pattern, pattern_path = resolve_pattern(get_resolver(get_urlconf()), path)
+            if pattern is not None and pattern_path.count(placeholder) == 1:
+                self.prefix, self.suffix = url.split(placeholder)
+                self.regex = pattern.regex
+                self.path_prefix, self.path_suffix = pattern_path.split(placeholder)
+                break
+
+    def __call__(self, pk):
+        """
+        Returns the url for the object
+
+        :param pk: primary key of the object
+        :return: url
+        """
+        if self.prefix is not None:
+            text = force_text(pk)
+            match = self.regex.search(self.path_prefix + text + self.path_suffix)
+            if match and text in match.groups():
+                # Quoted the way reverse quotes the arguments
+                return self.prefix + urlquote(text, safe=RFC3986_SUBDELIMS + str('/~:@')) + self.suffix
+        return reverse(self.viewname, args=[pk], current_app=self.current_app)
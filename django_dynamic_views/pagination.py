@@ -0,0 +1,165 @@
+import base64
+import json
+
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+
+from .counts import ExactCount
+
+KEYSET_ANNOTATION = 'dynamic_keyset_value'
+
+
+def encode_cursor(direction, value, pk):
+    """
+    Creates an opaque cursor for the GET parameters
+
+    :param direction: 'next' for the items after, 'previous' for the items before the position
+    :param value: value of the ordered column at the position
+    :param pk: primary key at the position
+    :return: string cursor
+    """
+    data = json.dumps([direction, value, pk], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a cursor created by encode_cursor
+
+    :param cursor: string cursor
+    :return: tuple (direction, value, pk) or None when the cursor is invalid
+    """
+    try:
+        direction, value, pk = json.loads(base64.urlsafe_b64decode(str(cursor)).decode('utf-8'))
+    except (TypeError, ValueError):
+        return None
+
+    if direction not in ('next', 'previous'):
+        return None
+
+    return direction, value, pk
+
+
+class KeysetPage(object):
+    """
+    A page of a KeysetPaginator. It only knows its neighbours, not its number.
+    """
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator(object):
+    """
+    Paginates by seeking on the ordered column plus the primary key instead of using OFFSET,
+    so deep pages are as fast as the first one and no COUNT is needed.
+
+    Rows where the ordered column is NULL are skipped, so order on non nullable columns.
+    """
+
+    def __init__(self, queryset, per_page, order_by=''):
+        self.per_page = int(per_page)
+        self.descending = order_by.startswith('-')
+        self.order_field = order_by.lstrip('-')
+
+        if self.order_field:
+            queryset = queryset.annotate(**{KEYSET_ANNOTATION: F(self.order_field)})
+        self.queryset = queryset
+
+    def get_position(self, obj):
+        """
+        Returns the (value, pk) position of an object in the ordering
+        """
+        value = getattr(obj, KEYSET_ANNOTATION) if self.order_field else None
+        return value, obj.pk
+
+    def seek(self, value, pk, forward):
+        """
+        Returns the queryset of the items after (forward) or before the position,
+        ordered in the direction they are read. Without a position it starts at the beginning.
+        """
+        descending = self.descending != (not forward)
+        lookup = 'lt' if descending else 'gt'
+        prefix = '-' if descending else ''
+
+        if self.order_field:
+            queryset = self.queryset.order_by(prefix + KEYSET_ANNOTATION, prefix + 'pk')
+        else:
+            queryset = self.queryset.order_by(prefix + 'pk')
+
+        if pk is None:
+            return queryset
+
+        if not self.order_field:
+            return queryset.filter(**{'pk__{}'.format(lookup): pk})
+
+        return queryset.filter(
+            Q(**{'{}__{}'.format(KEYSET_ANNOTATION, lookup): value}) |
+            Q(**{KEYSET_ANNOTATION: value, 'pk__{}'.format(lookup): pk})
+        )
+
+    def page(self, cursor=None):
+        """
+        Returns the page at the cursor, the first page if there is no (valid) cursor
+
+        :param cursor: string cursor from encode_cursor
+        :return: KeysetPage
+        """
+        position = decode_cursor(cursor) if cursor else None
+        direction, value, pk = position or ('next', None, None)
+        forward = direction == 'next'
+
+        object_list = list(self.seek(value, pk, forward)[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+
+        if not forward:
+            object_list.reverse()
+
+        next_cursor = previous_cursor = None
+        if object_list:
+            if has_more or not forward:
+                next_cursor = encode_cursor('next', *self.get_position(object_list[-1]))
+            if pk is not None and (forward or has_more):
+                previous_cursor = encode_cursor('previous', *self.get_position(object_list[0]))
+
+        return KeysetPage(object_list, self, next_cursor, previous_cursor)
+
+
+class CountPaginator(Paginator):
+    """
+    Paginator that leaves counting the items to a count strategy (see the counts module).
+    count_estimated tells if the count is an estimate.
+    """
+    count_estimated = False
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, count_strategy=None,
+                 view=None):
+        super(CountPaginator, self).__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.count_strategy = count_strategy or ExactCount()
+        self.view = view
+
+    @cached_property
+    def count(self):
+        count, self.count_estimated = self.count_strategy.count(self.object_list, self.view)
+        return count
@@ -0,0 +1,259 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.fields.related import ForeignObjectRel
+
+LOOKUP_SEP = '__'
+
+
+def split_path(path):
+    """
+    Splits a field path the same way the get_attribute_recursive filter does
+
+    :param path: field path (e.g. author__name or author.name)
+    :return: list of path parts
+    """
+    if LOOKUP_SEP in path:
+        return path.split(LOOKUP_SEP)
+    elif '.' in path:
+        return path.split('.')
+    return [path]
+
+
+def get_model_field(model, name):
+    """
+    Returns the (forward or reverse) field of a model with the given name.
+
+    Reverse relations can be referred to by their query name (book) as well as
+    by their accessor name (book_set). Returns None when the name is not a field.
+
+    :param model: model class
+    :param name: field name
+    :return: field or None
+    """
+    if name == 'pk':
+        return model._meta.pk
+
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        pass
+
+    for related_object in model._meta.related_objects:
+        if related_object.get_accessor_name() == name:
+            return related_object
+
+    return None
+
+
+class Join(object):
+    """
+    A relation that is traversed by a field path
+    """
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+        self.model = field.related_model
+        self.multi_valued = bool(field.many_to_many or field.one_to_many)
+
+
+class FieldPath(object):
+    """
+    A field path resolved against the model _meta
+
+    The kind tells what the path ends on:
+
+    * column: a concrete database column
+    * relation: a related object (e.g. author, rendered with its __str__)
+    * attribute: a python attribute, method or property
+    """
+    COLUMN = 'column'
+    RELATION = 'relation'
+    ATTRIBUTE = 'attribute'
+
+    def __init__(self, model, path):
+        self.model = model
+        self.path = path
+        self.joins = []
+        self.name = None
+
+        target = model
+        for name in split_path(path):
+            field = get_model_field(target, name)
+
+            if field is None or (field.is_relation and field.related_model is None):
+                # Not a field (or a generic relation): a python attribute on target
+                self.kind = self.ATTRIBUTE
+                self.name = name
+                break
+
+            if field.is_relation:
+                join = Join(field.get_accessor_name() if isinstance(field, ForeignObjectRel) else field.name, field)
+                self.joins.append(join)
+                target = join.model
+                continue
+
+            self.kind = self.COLUMN
+            self.name = field.name
+            break
+        else:
+            self.kind = self.RELATION
+
+        self.target_model = target
+
+    @property
+    def multi_valued(self):
+        """
+        True when the path crosses a reverse foreign key or a many to many relation
+        """
+        return any(join.multi_valued for join in self.joins)
+
+    @property
+    def select_related(self):
+        """
+        The single valued relation chain that can be joined with select_related
+
+        :return: string lookup or None
+        """
+        names = []
+        for join in self.joins:
+            if join.multi_valued:
+                break
+            names.append(join.name)
+
+        return LOOKUP_SEP.join(names) or None
+
+    @property
+    def prefetch_related(self):
+        """
+        The relation chain that has to be prefetched when it crosses a multi valued relation
+
+        :return: string lookup or None
+        """
+        if self.multi_valued:
+            return LOOKUP_SEP.join(join.name for join in self.joins)
+        return None
+
+    def only_fields(self):
+        """
+        Returns the columns that have to be loaded to render this path, or None
+        when the model instance has to be loaded completely.
+
+        :return: list of lookups or None
+        """
+        if self.multi_valued:
+            chain = self.select_related
+            return [chain] if chain else []
+
+        prefix = []
+        only = []
+        for join in self.joins:
+            prefix.append(join.name)
+            only.append(LOOKUP_SEP.join(prefix))
+
+        if self.kind == self.COLUMN:
+            return only + [LOOKUP_SEP.join(prefix + [self.name])]
+
+        if not self.joins:
+            # A python attribute on the listed model itself may use any field
+            return None
+
+        # A related object is rendered (or asked for an attribute) so load it completely
+        return only + [LOOKUP_SEP.join(prefix + [field.name]) for field in self.target_model._meta.concrete_fields]
+
+
+class QueryPlan(object):
+    """
+    Determines which relations to join or prefetch and which columns to load
+    for the field names rendered by a list.
+
+    Search, filter and order paths are resolved as well. They are only used in
+    the WHERE and ORDER BY clauses, so they don't add anything to be loaded.
+    """
+    _cache = {}
+
+    def __init__(self, model, field_names=(), search_fields=(), filter_fields=(), order_fields=()):
+        self.model = model
+        self.field_paths = [FieldPath(model, path) for path in field_names]
+        self.search_paths = [FieldPath(model, path) for path in search_fields]
+        self.filter_paths = [FieldPath(model, path) for filter_field in filter_fields for path in filter_field]
+        self.order_paths = [FieldPath(model, path) for path in order_fields]
+        self.paths = {}
+        for field_path in self.field_paths + self.search_paths + self.filter_paths + self.order_paths:
+            self.paths[field_path.path] = field_path
+
+        self.select_related = []
+        self.prefetch_related = []
+        self.only = ['pk']
+
+        for field_path in self.field_paths:
+            if field_path.select_related and field_path.select_related not in self.select_related:
+                self.select_related.append(field_path.select_related)
+
+            if field_path.prefetch_related and field_path.prefetch_related not in self.prefetch_related:
+                self.prefetch_related.append(field_path.prefetch_related)
+
+            only_fields = field_path.only_fields()
+            if only_fields is None or self.only is None:
+                self.only = None
+            else:
+                self.only.extend(field for field in only_fields if field not in self.only)
+
+    @classmethod
+    def for_model(cls, model, field_names=(), search_fields=(), filter_fields=(), order_fields=()):
+        """
+        Returns a cached plan, the model _meta doesn't change while the process runs
+        """
+        key = (model, tuple(field_names), tuple(search_fields),
+               tuple(tuple(filter_field) for filter_field in filter_fields), tuple(order_fields))
+        if key not in cls._cache:
+            cls._cache[key] = cls(model, *key[1:])
+        return cls._cache[key]
+
+    def get_path(self, path):
+        """
+        Returns the resolved FieldPath of a path, paths that are not part of the
+        configuration are resolved once as well.
+
+        :param path: field path
+        :return: FieldPath
+        """
+        if path not in self.paths:
+            self.paths[path] = FieldPath(self.model, path)
+        return self.paths[path]
+
+    def multi_valued(self, paths):
+        """
+        Returns True when any of the paths crosses a reverse foreign key or many to many relation
+
+        :param paths: field paths
+        :return: boolean
+        """
+        return any(self.get_path(path).multi_valued for path in paths)
+
+    @property
+    def models(self):
+        """
+        The model and all the related models the paths traverse, sorted by label
+        """
+        models = {self.model}
+        for field_path in self.paths.values():
+            models.update(join.model for join in field_path.joins)
+        return sorted(models, key=lambda model: model._meta.label)
+
+    def apply(self, queryset, only=False):
+        """
+        Adds select_related, prefetch_related and optionally only() to the queryset
+
+        :param queryset: current queryset
+        :param only: restrict the loaded columns to the rendered ones
+        :return: modified queryset
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        if only and self.only is not None:
+            queryset = queryset.only(*self.only)
+
+        return queryset
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+
+class CRUDRegistry(object):
+    """
+    The DynamicCRUDView classes that have a model, registered when the class is created
+    """
+
+    def __init__(self):
+        self._views = OrderedDict()
+
+    def register(self, crud_class):
+        """
+        Registers a DynamicCRUDView class, a class with the same module and name replaces the previous one
+
+        :param crud_class: DynamicCRUDView subclass
+        """
+        self._views[(crud_class.__module__, crud_class.__name__)] = crud_class
+
+    def unregister(self, crud_class):
+        """
+        Removes a registered DynamicCRUDView class, e.g. a class defined in a test
+
+        :param crud_class: DynamicCRUDView subclass
+        """
+        key = (crud_class.__module__, crud_class.__name__)
+        if self._views.get(key) is crud_class:
+            del self._views[key]
+
+    def __iter__(self):
+        return iter(list(self._views.values()))
+
+    def __len__(self):
+        return len(self._views)
+
+    @property
+    def models(self):
+        """
+        The models that have a registered DynamicCRUDView
+
+        :return: list of model classes
+        """
+        models = []
+        for crud_class in self:
+            if crud_class.model not in models:
+                models.append(crud_class.model)
+        return models
+
+    def get_for_model(self, model):
+        """
+        Returns the DynamicCRUDView classes of a model
+
+        :param model: model class
+        :return: list of DynamicCRUDView classes
+        """
+        return [crud_class for crud_class in self if crud_class.model is model]
+
+
+registry = CRUDRegistry()
@@ -0,0 +1,114 @@
+import itertools
+import threading
+import time
+
+from django.conf import settings
+from django.db import router
+from django.utils import six
+
+PRIMARY_COOKIE = 'dynamic_views_primary'
+
+_cycles = {}
+_cycles_lock = threading.Lock()
+
+
+def next_alias(aliases):
+    """
+    Returns the next database alias of a round-robin set, the position is shared by all the
+    views with the same set
+
+    :param aliases: list of database aliases
+    :return: database alias
+    """
+    key = tuple(aliases)
+    with _cycles_lock:
+        if key not in _cycles:
+            _cycles[key] = itertools.cycle(key)
+        return next(_cycles[key])
+
+
+def is_pinned(request):
+    """
+    Determines if the user made changes a short while ago, so the reads should go to the primary
+
+    :param request: current request
+    :return: boolean
+    """
+    try:
+        return float(request.COOKIES.get(PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadDatabaseMixin(object):
+    """
+    Sends the read queries of a view to read_using: a database alias, or a list of aliases
+    (replicas) that are used round-robin. Defaults to the DYNAMIC_VIEWS_READ_DATABASES setting,
+    without either the database router decides.
+
+    After a change (see PrimaryPinMixin) the user reads from the primary, so the change is visible
+    even when the replicas lag behind.
+    """
+    read_using = None
+
+    def get_read_databases(self):
+        """
+        :return: list of database aliases
+        """
+        read_using = self.read_using or getattr(settings, 'DYNAMIC_VIEWS_READ_DATABASES', None)
+        if not read_using:
+            return []
+        if isinstance(read_using, six.string_types):
+            return [read_using]
+        return list(read_using)
+
+    def get_read_using(self):
+        """
+        Returns the database alias the read queries of the current request go to, one alias
+        per request so the count, page and filters are consistent
+
+        :return: database alias or None for the database router
+        """
+        if not hasattr(self, '_read_using'):
+            read_databases = self.get_read_databases()
+            if not read_databases:
+                self._read_using = None
+            elif is_pinned(self.request):
+                self._read_using = router.db_for_write(self.get_queryset_model())
+            else:
+                self._read_using = next_alias(read_databases)
+        return self._read_using
+
+    def get_queryset_model(self):
+        if self.model:
+            return self.model
+        return self.queryset.model
+
+    def use_read_database(self, queryset):
+        """
+        Sends the queryset to the read database
+
+        :param queryset: queryset
+        :return: modified queryset
+        """
+        using = self.get_read_using()
+        if using:
+            queryset = queryset.using(using)
+        return queryset
+
+
+class PrimaryPinMixin(object):
+    """
+    Pins the user to the primary database for primary_pin_seconds after a POST that didn't fail,
+    with a cookie, so the views with ReadDatabaseMixin show the changes (read-your-writes)
+    """
+    primary_pin_seconds = 5
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super(PrimaryPinMixin, self).dispatch(request, *args, **kwargs)
+
+        if request.method == 'POST' and response.status_code < 400 and self.primary_pin_seconds:
+            response.set_cookie(PRIMARY_COOKIE, str(time.time() + self.primary_pin_seconds),
+                                max_age=self.primary_pin_seconds, httponly=True)
+
+        return response
@@ -0,0 +1,101 @@
+import threading
+from collections import OrderedDict
+
+from django.db import close_old_connections, connections
+
+
+class SequentialRunner(object):
+    """
+    Runs the independent read queries of a list one after another, the default behaviour.
+
+    A runner gets the queries as callables, so another runner can evaluate them concurrently.
+    """
+
+    def run(self, queries):
+        """
+        Evaluates the queries
+
+        :param queries: OrderedDict with name -> callable without arguments
+        :return: OrderedDict with name -> result
+        """
+        return OrderedDict((name, query()) for name, query in queries.items())
+
+
+class ThreadPoolRunner(SequentialRunner):
+    """
+    Runs the independent read queries of a list concurrently, so the latency of a page
+    approaches the slowest query instead of the sum of the queries.
+
+    The first query runs in the request thread, the others on a thread pool that is shared by
+    all the requests using this runner. Every pool thread has its own database connection, so
+    the pool adds at most max_workers connections per process. When all the workers are busy
+    the queries run in the request thread instead of waiting in a queue. Old connections of the
+    workers are closed like at the end of a request, set CONN_MAX_AGE to keep them open.
+
+    Inside a transaction (e.g. ATOMIC_REQUESTS) the queries run sequentially, as other
+    connections can't see its changes.
+
+    Uses concurrent.futures, on Python 2 the futures package has to be installed.
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.slots = threading.BoundedSemaphore(max_workers)
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def get_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    @staticmethod
+    def in_transaction():
+        return any(connection.in_atomic_block for connection in connections.all())
+
+    def run_query(self, query):
+        """
+        Runs one query on a worker thread
+        """
+        close_old_connections()
+        try:
+            return query()
+        finally:
+            close_old_connections()
+            self.slots.release()
+
+    def run(self, queries):
+        if len(queries) < 2 or self.in_transaction():
+            return super(ThreadPoolRunner, self).run(queries)
+
+        from concurrent.futures import wait
+
+        items = list(queries.items())
+        inline = items[:1]
+        futures = OrderedDict()
+
+        for name, query in items[1:]:
+            if self.slots.acquire(False):
+                try:
+                    futures[name] = self.get_executor().submit(self.run_query, query)
+                except Exception:
+                    self.slots.release()
+                    raise
+            else:
+                inline.append((name, query))
+
+        results = {}
+        try:
+            for name, query in inline:
+                results[name] = query()
+        finally:
+            # Don't leave queries running when one failed
+            wait(futures.values())
+
+        for name, future in futures.items():
+            results[name] = future.result()
+
+        return OrderedDict((name, results[name]) for name in queries)
@@ -0,0 +1,232 @@
+from django.db import connections
+from django.db.models import F, Max, Q
+from django.utils.text import smart_split, unescape_string_literal
+
+# The legacy __search lookup (the @ prefix of the admin) was removed in Django 1.10 and is not
+# implemented on most databases, full text search is done with PostgresFullTextSearch instead
+SEARCH_LOOKUPS = {
+    '^': 'istartswith',
+    '=': 'iexact',
+}
+
+
+def split_search_field(search_field):
+    """
+    Splits the lookup prefix from a search field
+
+    * ^title: istartswith
+    * =isbn: iexact
+    * title: icontains
+
+    :param search_field: search field with optional prefix
+    :return: tuple (field path, lookup)
+    """
+    if search_field[:1] in SEARCH_LOOKUPS:
+        return search_field[1:], SEARCH_LOOKUPS[search_field[0]]
+    return search_field, 'icontains'
+
+
+def split_search_phrase(search_phrase):
+    """
+    Splits the search phrase in terms, a quoted part is kept as one term
+
+    :param search_phrase: search phrase of the user
+    :return: list of terms
+    """
+    terms = []
+    for term in smart_split(search_phrase):
+        if term.startswith(('"', "'")) and term[0] == term[-1] and len(term) > 1:
+            term = unescape_string_literal(term)
+        if term:
+            terms.append(term)
+    return terms
+
+
+class IContainsSearch(object):
+    """
+    Searches every term of the search phrase in the search fields, the default behaviour.
+    All the terms have to match (AND), a term has to match one of the fields (OR).
+
+    Fields are looked up with __icontains, unless they are prefixed:
+    ^ for istartswith and = for iexact.
+    """
+
+    def search_paths(self, search_fields):
+        """
+        Returns the field paths that are joined in the query when searching
+
+        :param search_fields: fields of the view that can be searched in
+        :return: list of field paths
+        """
+        return [split_search_field(search_field)[0] for search_field in search_fields]
+
+    def search(self, queryset, search_fields, search_phrase):
+        """
+        Modifies the queryset with the search phrase
+
+        :param queryset: current queryset
+        :param search_fields: fields of the view that can be searched in
+        :param search_phrase: search phrase of the user
+        :return: modified queryset
+        """
+        lookups = ['{}__{}'.format(*split_search_field(search_field)) for search_field in search_fields]
+
+        for term in split_search_phrase(search_phrase):
+            query = Q()
+            for lookup in lookups:
+                query |= Q(**{lookup: term})
+            queryset = queryset.filter(query)
+
+        return queryset
+
+    def add_rank(self, queryset, search_fields, search_phrase, aggregate=False):
+        """
+        Orders the searched queryset on relevance, by default the results are not ranked.
+        It is applied after the duplicates are removed, with aggregate the search paths join a
+        multi-valued relation and the best rank of the related rows is used.
+
+        :param queryset: searched queryset without duplicates
+        :param search_fields: fields of the view that can be searched in
+        :param search_phrase: search phrase of the user
+        :param aggregate: rank with an aggregate, one row per item
+        :return: modified queryset
+        """
+        return queryset
+
+
+class PostgresFullTextSearch(IContainsSearch):
+    """
+    Searches with PostgreSQL full text search (SearchVector / SearchQuery).
+
+    When vector_field is given, the stored (and indexed) tsvector column is searched instead of
+    building the vector from the search fields on every query. With rank the results are
+    ordered on relevance when the user didn't choose an ordering.
+
+    Requires django.contrib.postgres.
+    """
+
+    def __init__(self, config=None, vector_field=None, rank=False):
+        self.config = config
+        self.vector_field = vector_field
+        self.rank = rank
+
+    def search_paths(self, search_fields):
+        if self.vector_field:
+            return []
+        return super(PostgresFullTextSearch, self).search_paths(search_fields)
+
+    def get_vector(self, search_fields):
+        from django.contrib.postgres.search import SearchVector
+
+        if self.vector_field:
+            return F(self.vector_field)
+        return SearchVector(*self.search_paths(search_fields), config=self.config)
+
+    def search(self, queryset, search_fields, search_phrase):
+        from django.contrib.postgres.search import SearchQuery
+
+        query = SearchQuery(search_phrase, config=self.config)
+
+        if self.vector_field:
+            return queryset.filter(**{self.vector_field: query})
+        return queryset.annotate(search_vector=self.get_vector(search_fields)).filter(search_vector=query)
+
+    def add_rank(self, queryset, search_fields, search_phrase, aggregate=False):
+        if not self.rank:
+            return queryset
+
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        rank = SearchRank(self.get_vector(search_fields), SearchQuery(search_phrase, config=self.config))
+        if aggregate:
+            rank = Max(rank)
+        return queryset.annotate(search_rank=rank).order_by('-search_rank')
+
+
+class TrigramSearch(IContainsSearch):
+    """
+    Searches with PostgreSQL trigram similarity (__trigram_similar), which can use a
+    pg_trgm GIN index. With rank the results are ordered on similarity when the user
+    didn't choose an ordering.
+
+    Requires django.contrib.postgres and the pg_trgm extension.
+    """
+
+    def __init__(self, rank=False):
+        self.rank = rank
+
+    def search(self, queryset, search_fields, search_phrase):
+        query = Q()
+        for search_path in self.search_paths(search_fields):
+            query |= Q(**{'{}__trigram_similar'.format(search_path): search_phrase})
+        return queryset.filter(query)
+
+    def add_rank(self, queryset, search_fields, search_phrase, aggregate=False):
+        if not self.rank:
+            return queryset
+
+        from django.contrib.postgres.search import TrigramSimilarity
+        from django.db.models.functions import Greatest
+
+        similarities = [TrigramSimilarity(search_path, search_phrase)
+                        for search_path in self.search_paths(search_fields)]
+        similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+        if aggregate:
+            similarity = Max(similarity)
+        return queryset.annotate(search_similarity=similarity).order_by('-search_similarity')
+
+
+class SQLiteFTS5Search(IContainsSearch):
+    """
+    Searches an SQLite FTS5 table. The rowid of the table is the primary key of the model,
+    the other columns contain the searchable text. Use rebuild to (re)fill the table, e.g. in tests.
+
+    Every word of the search phrase has to match.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def search_paths(self, search_fields):
+        return []
+
+    @staticmethod
+    def match_expression(search_phrase):
+        """
+        Quotes every word of the search phrase, so the FTS5 query syntax is not interpreted
+
+        :param search_phrase: search phrase of the user
+        :return: FTS5 MATCH expression
+        """
+        return ' '.join('"{}"'.format(word.replace('"', '""')) for word in search_phrase.split())
+
+    def search(self, queryset, search_fields, search_phrase):
+        expression = self.match_expression(search_phrase)
+        if not expression:
+            return queryset
+
+        quote_name = connections[queryset.db].ops.quote_name
+        opts = queryset.model._meta
+        where = '{}.{} IN (SELECT rowid FROM {table} WHERE {table} MATCH %s)'.format(
+            quote_name(opts.db_table), quote_name(opts.pk.column), table=quote_name(self.table))
+        return queryset.extra(where=[where], params=[expression])
+
+    def rebuild(self, queryset, search_fields):
+        """
+        Creates the FTS5 table if needed and fills it with the search fields of the queryset
+
+        :param queryset: items to index
+        :param search_fields: fields to index, one column per field
+        """
+        connection = connections[queryset.db]
+        table = connection.ops.quote_name(self.table)
+        columns = ', '.join('c{}'.format(index) for index in range(len(search_fields)))
+
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5({})'.format(table, columns))
+            cursor.execute('DELETE FROM {}'.format(table))
+            placeholders = ', '.join(['%s'] * (len(search_fields) + 1))
+            cursor.executemany(
+                'INSERT INTO {} (rowid, {}) VALUES ({})'.format(table, columns, placeholders),
+                queryset.order_by().values_list('pk', *search_fields).iterator()
+            )
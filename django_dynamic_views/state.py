@@ -0,0 +1,88 @@
+class ListState(object):
+    """
+    The search, filter, order and pagination state of a list request.
+
+    It is parsed once from the GET parameters when the request is dispatched,
+    all the hooks of the list view read from it.
+    """
+
+    def __init__(self, search_phrase='', order_by='', filter_kwargs=None, page=None, paginate_by=None,
+                 cursor=None):
+        self.search_phrase = search_phrase
+        self.order_by = order_by
+        self.filter_kwargs = filter_kwargs or {}
+        self.page = page
+        self.paginate_by = paginate_by
+        self.cursor = cursor
+
+    @classmethod
+    def from_request(cls, request, field_names=(), order_fields=(), filter_fields=(), paginate_by=None):
+        """
+        Parses the GET parameters of the request
+
+        :param request: current request
+        :param field_names: field names of the list, order_by has to be one of them
+        :param order_fields: field names that can be ordered on
+        :param filter_fields: (filter_key, filter_name) tuples
+        :param paginate_by: default number of items per page
+        :return: ListState
+        """
+        params = request.GET
+
+        order_by = params.get('order_by', None)
+        if order_by in field_names and order_by in order_fields:
+            if params.get('sort') == 'DESC':
+                order_by = '-%s' % order_by
+        else:
+            order_by = ''
+
+        filter_kwargs = {}
+        for filter_key, filter_name in filter_fields:
+            filter_value = params.get('filter-{}'.format(filter_key))
+            if filter_value and filter_value != '---':
+                filter_kwargs[filter_key] = str(filter_value)
+
+        # An invalid page size falls back to the default
+        try:
+            page_size = int(params.get('paginate_by', paginate_by))
+        except (TypeError, ValueError):
+            page_size = None
+        if page_size and page_size > 0:
+            paginate_by = page_size
+
+        return cls(
+            search_phrase=params.get('search_phrase', ''),
+            order_by=order_by,
+            filter_kwargs=filter_kwargs,
+            page=params.get('page'),
+            paginate_by=paginate_by,
+            cursor=params.get('cursor'),
+        )
+
+    @property
+    def order_field(self):
+        """
+        The field that is ordered on, without the direction
+
+        :return: string field name
+        """
+        return self.order_by[1:] if self.order_by.startswith('-') else self.order_by
+
+    def normalized(self, ordering=True, pagination=True):
+        """
+        Returns a hashable representation of the state, e.g. to build cache keys.
+        The filters are sorted so their order in the url doesn't matter.
+
+        :param ordering: include the ordering
+        :param pagination: include the page, page size and cursor
+        :return: tuple
+        """
+        state = (self.search_phrase, tuple(sorted(self.filter_kwargs.items())))
+
+        if ordering:
+            state += (self.order_by,)
+
+        if pagination:
+            state += (self.page or '1', str(self.paginate_by or ''), self.cursor or '')
+
+        return state
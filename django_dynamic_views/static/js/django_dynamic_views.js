@@ -0,0 +1,102 @@
+/*
+ * Lazy (type-ahead) filter dropdowns of the dynamic list view.
+ *
+ * The options of a lazy filter are not rendered in the page, they are loaded from the
+ * filter options endpoint with the current search and filters, the filter key and the typed term.
+ */
+(function () {
+    'use strict';
+
+    var DELAY = 250;
+
+    function optionsUrl(menu, term) {
+        var filter = menu.getAttribute('data-filter');
+        var params = [];
+        var query = window.location.search.replace(/^\?/, '');
+
+        if (query) {
+            query.split('&').forEach(function (param) {
+                var name = decodeURIComponent(param.split('=')[0]);
+                // The filter itself would restrict its options to the selected value
+                if (name && name !== 'filter-' + filter && name !== 'page' && name !== 'cursor') {
+                    params.push(param);
+                }
+            });
+        }
+
+        params.push('filter_options=' + encodeURIComponent(filter));
+        params.push('term=' + encodeURIComponent(term));
+        return menu.getAttribute('data-url') + '?' + params.join('&');
+    }
+
+    function renderOptions(menu, options) {
+        var filter = menu.getAttribute('data-filter');
+        var counts = menu.getAttribute('data-counts');
+        var divider = menu.querySelector('.divider');
+
+        Array.prototype.forEach.call(menu.querySelectorAll('.dynamic-lazy-filter-option'), function (item) {
+            menu.removeChild(item);
+        });
+
+        options.forEach(function (option) {
+            var item = document.createElement('li');
+            var link = document.createElement('a');
+            item.className = 'dynamic-lazy-filter-option';
+            link.href = '?filter-' + filter + '=' + encodeURIComponent(option[0]);
+            link.textContent = counts ? option[1] + ' (' + option[2] + ')' : option[1];
+            item.appendChild(link);
+            menu.insertBefore(item, divider);
+        });
+    }
+
+    function loadOptions(menu, term) {
+        var request = new XMLHttpRequest();
+        menu.lastTerm = term;
+
+        request.onload = function () {
+            // Ignore the responses of terms that were typed over
+            if (request.status === 200 && menu.lastTerm === term) {
+                renderOptions(menu, JSON.parse(request.responseText).options);
+            }
+        };
+        request.open('GET', optionsUrl(menu, term));
+        request.setRequestHeader('X-Requested-With', 'XMLHttpRequest');
+        request.send();
+    }
+
+    function initMenu(menu) {
+        var input = menu.querySelector('.dynamic-lazy-filter-term');
+        var timer = null;
+
+        input.addEventListener('click', function (event) {
+            // Keep the dropdown open
+            event.stopPropagation();
+        });
+
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(function () {
+                loadOptions(menu, input.value);
+            }, DELAY);
+        });
+
+        menu.parentNode.querySelector('.dropdown-toggle').addEventListener('click', function () {
+            if (menu.lastTerm === undefined) {
+                loadOptions(menu, '');
+            }
+            setTimeout(function () {
+                input.focus();
+            }, 0);
+        });
+    }
+
+    function init() {
+        Array.prototype.forEach.call(document.querySelectorAll('.dynamic-lazy-filter'), initMenu);
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', init);
+    } else {
+        init();
+    }
+})();
@@ -0,0 +1,42 @@
+from django import template
+
+register = template.Library()
+
+
+class FragmentNode(template.Node):
+    def __init__(self, name, nodelist):
+        self.name = name
+        self.nodelist = nodelist
+
+    def render(self, context):
+        fragment_cache = context.get('fragment_cache')
+        if not fragment_cache:
+            return self.nodelist.render(context)
+
+        if fragment_cache.has(self.name):
+            return fragment_cache.get(self.name)
+
+        output = self.nodelist.render(context)
+        fragment_cache.set(self.name, output)
+        return output
+
+
+@register.tag
+def dynamic_fragment(parser, token):
+    """
+    Caches the rendered content with the key the list view put in the fragment_cache context variable.
+    Without fragment cache the content is rendered as is.
+
+    Usage (in template):
+
+    {% dynamic_fragment table %}
+        ...
+    {% enddynamic_fragment %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError("'{}' takes one argument, the fragment name".format(bits[0]))
+
+    nodelist = parser.parse(('enddynamic_fragment',))
+    parser.delete_first_token()
+    return FragmentNode(bits[1], nodelist)
@@ -1,13 +1,14 @@
 from django.conf import settings
 from django.template.defaulttags import register
 
-from .get_attribute import get_attribute_recursive
+from ..accessors import get_accessor
 
 
 @register.simple_tag()
 def field_value(object, field_name, convert_field_values, view, *args, **kwargs):
     """
-    Retrieves field name from the object and converts its value
+    Retrieves field name from the object and converts its value.
+    The field name is looked up with the accessor compiled for the class of the object.
 
     :param object: object in the field set
     :param field_name: field name (e.g. comment__author )
@@ -17,13 +18,13 @@ def field_value(object, field_name, convert_field_values, view, *args, **kwargs)
     :param kwargs:
     :return: string value
     """
-    value = get_attribute_recursive(object, field_name, return_as_string=False)
+    value = get_accessor(object.__class__, field_name)(object)
     if convert_field_values.get(field_name):
         try:
             value = getattr(view, convert_field_values.get(field_name))(value)
         except Exception as e:
             if settings.DEBUG:
-                value = 'Error parsing {}: {}'.format(convert_field_values.get(field_name, str(e)))
+                value = 'Error parsing {}: {}'.format(convert_field_values.get(field_name), e)
             else:
                 value = ''
 
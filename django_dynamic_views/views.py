@@ -1,11 +1,53 @@
+import csv
+from collections import OrderedDict, namedtuple
+from functools import partial
+
+import django
+from django.conf import settings
 from django.conf.urls import url
 from django.core.urlresolvers import reverse_lazy
-from django.db.models import Q
-from django.db.models.deletion import Collector
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
+from django.core.paginator import InvalidPage
+from django.db import DatabaseError, router, transaction
+from django.db.models import Count
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.query import QuerySet
+from django.forms import modelform_factory
+from django.http import Http404, HttpResponseBadRequest, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
+from django.utils import six
+from django.utils.encoding import force_text
 from django.utils.text import slugify
-from django.views.generic import ListView, CreateView, UpdateView, DetailView, DeleteView
-
-class DynamicListView(ListView):
+from django.utils.translation import get_language, ugettext as _
+from django.views.generic import ListView, CreateView, UpdateView, DetailView, DeleteView, FormView
+from django.views.generic.list import MultipleObjectMixin
+
+from .accessors import get_accessor
+from .cache import FragmentCache, bump_model_version, get_cache, get_model_versions, make_key
+from .deletion import DeleteCounter
+from .imports import ImportForm, import_row_form_factory, read_csv_rows, read_jsonl_rows
+from .links import LinkPattern
+from .pagination import KEYSET_ANNOTATION, CountPaginator, KeysetPaginator
+from .query import FieldPath, LOOKUP_SEP, QueryPlan, split_path
+from .registry import registry
+from .routing import PrimaryPinMixin, ReadDatabaseMixin
+from .runners import SequentialRunner
+from .search import IContainsSearch
+from .state import ListState
+
+
+class ValueJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder for cell values, values that can't be encoded (e.g. related objects)
+    are encoded as their text representation
+    """
+
+    def default(self, o):
+        try:
+            return super(ValueJSONEncoder, self).default(o)
+        except TypeError:
+            return force_text(o)
+
+class DynamicListView(ReadDatabaseMixin, ListView):
     template_name = 'django_dynamic_views/dynamic_list_view.html'
     ajax_template_name = None
     field_names = None
@@ -17,6 +59,53 @@ class DynamicListView(ListView):
     annotate_fields = None
     prefetch_related = []
     distinct = True
+    plan_related = True
+    plan_only = False
+    filter_counts = False
+    filter_limit = None
+    filter_limits = None
+    filter_cache = False
+    filter_cache_timeout = 86400
+    filter_lazy = False
+    filter_options_limit = 20
+    filter_options_url = None
+    filter_options_endpoint = False
+    keyset_pagination = False
+    keyset_threshold = None
+    paginator_class = CountPaginator
+    count_strategy = None
+    search_backend = None
+    projection = False
+    export_format = None
+    export_formats = []
+    export_chunk_size = 2000
+    ajax_json = False
+    fragment_cache = False
+    fragment_cache_timeout = 86400
+    query_runner = None
+    page_rows = None
+    prefetched_filter_options = None
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Parses the list state once, before the request is handled
+        """
+        self.list_state = self.get_list_state()
+        return super(DynamicListView, self).dispatch(request, *args, **kwargs)
+
+    def get_list_state(self):
+        """
+        Hook for parsing the search phrase, ordering, filtering and pagination from the request
+
+        :return: ListState
+        """
+        return ListState.from_request(
+            self.request,
+            field_names=self.get_field_names(),
+            order_fields=self.get_order_fields(),
+            filter_fields=self.get_filter_fields(),
+            paginate_by=self.paginate_by,
+        )
 
     def get_ajax_template_name(self):
         """
@@ -53,6 +142,16 @@ class DynamicListView(ListView):
             return self.field_names
         return []
 
+    def get_field_accessors(self):
+        """
+        Returns the field names compiled into accessors for the model of the list.
+        The accessors are cached per model class, so they are compiled once per process.
+
+        :return: dict with field name -> accessor
+        """
+        model = self.get_queryset_model()
+        return {field_name: get_accessor(model, field_name) for field_name in self.get_field_names()}
+
     def get_convert_field_values(self):
         """
         Dict with methods to be called on the view to convert a certain value
@@ -64,6 +163,320 @@ class DynamicListView(ListView):
         else:
             return {}
 
+    def get(self, request, *args, **kwargs):
+        """
+        Streams the export when an export format is requested, else the normal listview behaviour
+        """
+        export_format = self.get_export_format()
+        if export_format:
+            return self.export(export_format)
+
+        filter_field = self.get_filter_options_request()
+        if filter_field:
+            return JsonResponse(self.get_filter_options_data(*filter_field), encoder=ValueJSONEncoder)
+        if self.filter_options_endpoint:
+            raise Http404('Unknown filter')
+
+        if self.use_json_response():
+            return JsonResponse(self.get_json_data(), encoder=ValueJSONEncoder)
+
+        return super(DynamicListView, self).get(request, *args, **kwargs)
+
+    def use_json_response(self):
+        """
+        Determines if the list is returned as JSON instead of HTML: when ajax_json is set
+        and the request is made with AJAX
+
+        :return: boolean
+        """
+        return self.ajax_json and self.request.is_ajax()
+
+    def get_json_pagination(self, paginator, page):
+        """
+        Returns the pagination info of the JSON response
+
+        :return: dict
+        """
+        if page is None:
+            return None
+
+        if isinstance(paginator, KeysetPaginator):
+            return {
+                'paginate_by': paginator.per_page,
+                'next_cursor': page.next_cursor,
+                'previous_cursor': page.previous_cursor,
+            }
+
+        return {
+            'paginate_by': paginator.per_page,
+            'page': page.number,
+            'num_pages': paginator.num_pages,
+            'count': paginator.count,
+            'count_estimated': getattr(paginator, 'count_estimated', False),
+            'has_next': page.has_next(),
+            'has_previous': page.has_previous(),
+        }
+
+    def get_json_data(self):
+        """
+        Returns the rows, pagination, ordering and filtering of the list as data for a JSON response,
+        without rendering a template. The filter dropdown values are added when the filter_values
+        GET parameter is given.
+
+        :return: dict
+        """
+        queryset = self.get_queryset()
+        page_size = self.get_paginate_by(queryset)
+        paginator = page = None
+        if page_size:
+            paginator, page, queryset, is_paginated = self.paginate_queryset(queryset, page_size)
+
+        verbose_names = self.get_field_verbose_names()
+        data = {
+            'fields': [{'name': field_name, 'verbose_name': verbose_names.get(field_name, field_name)}
+                       for field_name in self.get_field_names()],
+            'rows': [{'pk': obj['pk'] if isinstance(obj, dict) else obj.pk, 'cells': cells}
+                     for obj, cells in self.get_page_rows(queryset)],
+            'pagination': self.get_json_pagination(paginator, page),
+            'order_by': self.list_state.order_field,
+            'sort': 'DESC' if self.order_by.startswith('-') else 'ASC',
+            'search_phrase': self.search_phrase,
+            'filters': self.filter_kwargs,
+        }
+
+        if self.use_filter_values():
+            data['filter_values'] = [
+                {'filter': filter_key, 'name': name, 'values': values, 'selected': selected_name}
+                for filter_key, name, values, selected_name in self.get_filter_values()
+            ]
+
+        return data
+
+    def get_export_format(self):
+        """
+        Returns the requested export format: the export GET parameter or the export_format
+        attribute, if it is one of the export_formats.
+
+        :return: 'csv', 'jsonl' or None
+        """
+        export_format = self.request.GET.get('export', self.export_format)
+        if export_format in self.export_formats:
+            return export_format
+        return None
+
+    def use_export_chunks(self, queryset):
+        """
+        Determines if the export can be read in keyset chunks: the list is ordered on a non nullable
+        column of the listed model, or it is not ordered at all (then the chunks are in pk order)
+
+        :param queryset: searched, filtered and ordered queryset
+        :return: boolean
+        """
+        if not self.order_by:
+            return not queryset.ordered
+
+        field_path = FieldPath(self.get_queryset_model(), self.list_state.order_field)
+        if field_path.kind != FieldPath.COLUMN or field_path.joins:
+            return False
+        return not field_path.target_model._meta.get_field(field_path.name).null
+
+    def iterate_export(self, queryset, lookups):
+        """
+        Iterates the items of the export, export_chunk_size items per query. The chunks seek on the
+        ordered column and the primary key like the keyset pagination, so only one chunk is in memory.
+        iterator() can't be used for that: before Django 2.0 it reads the whole result set into the
+        client on PostgreSQL and MySQL.
+
+        When use_export_chunks is False the items are read with one iterator(), which only keeps the
+        memory flat with the server side cursors of Django 2.0 and later.
+
+        :param queryset: searched, filtered and ordered queryset
+        :param lookups: columns to retrieve with values_list(), or None for model instances
+        :return: generator of value tuples or model instances
+        """
+        if not self.use_export_chunks(queryset):
+            iterator_kwargs = {'chunk_size': self.export_chunk_size} if django.VERSION >= (2, 0) else {}
+            items = queryset.values_list(*lookups) if lookups else queryset
+            for item in items.iterator(**iterator_kwargs):
+                yield item
+            return
+
+        paginator = KeysetPaginator(queryset, self.export_chunk_size, self.order_by)
+        position = (None, None)
+
+        while True:
+            chunk = paginator.seek(position[0], position[1], True)[:self.export_chunk_size]
+            if lookups:
+                chunk = list(chunk.values_list(KEYSET_ANNOTATION if paginator.order_field else 'pk', 'pk', *lookups))
+                for values in chunk:
+                    yield values[2:]
+                positions = [values[:2] for values in chunk[-1:]]
+            else:
+                chunk = list(chunk)
+                for obj in chunk:
+                    yield obj
+                positions = [paginator.get_position(obj) for obj in chunk[-1:]]
+
+            if len(chunk) < self.export_chunk_size:
+                return
+            position = positions[0]
+
+    def get_export_rows(self, queryset):
+        """
+        Iterates the values of the field names of all the items in the queryset, retrieved in chunks
+        (see iterate_export) with values_list() when all field names are columns.
+
+        :param queryset: searched, filtered and ordered queryset
+        :return: generator of value lists
+        """
+        lookups = self.get_field_lookups()
+
+        if lookups:
+            for values in self.iterate_export(queryset.prefetch_related(None), lookups):
+                yield values
+        else:
+            accessors = self.get_field_accessors()
+            getters = [accessors[field_name] for field_name in self.get_field_names()]
+            for obj in self.iterate_export(queryset, None):
+                yield [getter(obj) for getter in getters]
+
+    def stream_csv(self, rows):
+        """
+        Writes the rows as CSV, with the verbose names as header
+
+        :param rows: generator of value lists
+        :return: generator of CSV lines
+        """
+        class Echo(object):
+            def write(self, value):
+                return value
+
+        def encode(values):
+            # The csv module of Python 2 only writes byte strings
+            if six.PY2:
+                return [force_text(value).encode('utf-8') for value in values]
+            return values
+
+        writer = csv.writer(Echo())
+        verbose_names = self.get_field_verbose_names()
+        yield writer.writerow(encode([verbose_names.get(field_name, field_name)
+                                      for field_name in self.get_field_names()]))
+
+        for values in rows:
+            yield writer.writerow(encode(['' if value is None else value for value in values]))
+
+    def stream_jsonl(self, rows):
+        """
+        Writes the rows as JSON Lines, one object with the field names as keys per line
+
+        :param rows: generator of value lists
+        :return: generator of JSON lines
+        """
+        field_names = self.get_field_names()
+        encoder = ValueJSONEncoder()
+
+        for values in rows:
+            yield encoder.encode(dict(zip(field_names, values))) + '\n'
+
+    def export(self, export_format):
+        """
+        Streams all the items of the list, with the same searching, filtering and ordering as the list
+
+        :param export_format: 'csv' or 'jsonl'
+        :return: StreamingHttpResponse
+        """
+        rows = self.get_export_rows(self.get_queryset())
+
+        if export_format == 'csv':
+            response = StreamingHttpResponse(self.stream_csv(rows), content_type='text/csv')
+        else:
+            response = StreamingHttpResponse(self.stream_jsonl(rows), content_type='application/x-ndjson')
+
+        response['Content-Disposition'] = 'attachment; filename="{}.{}"'.format(
+            slugify(self.get_queryset_model().__name__), export_format)
+        return response
+
+    def get_field_converters(self):
+        """
+        Returns the methods of convert_field_values, looked up once per column
+
+        :return: dict with field name -> (method name, bound method or None)
+        """
+        return {field_name: (method_name, getattr(self, method_name, None))
+                for field_name, method_name in self.get_convert_field_values().items()}
+
+    def get_field_lookups(self):
+        """
+        Returns the lookups to retrieve the field names with values_list() instead of instantiating
+        the model. This is only possible when all the field names are columns (e.g. author__name),
+        a method, property, related object or multi valued relation needs the model instances.
+
+        :return: list of lookups or None
+        """
+        lookups = []
+        for field_path in self.get_query_plan().field_paths:
+            if field_path.kind != FieldPath.COLUMN or field_path.multi_valued:
+                return None
+            lookups.append(LOOKUP_SEP.join(split_path(field_path.path)))
+
+        return lookups
+
+    def get_projection(self, object_list):
+        """
+        When projection is set, returns the lookups to retrieve the field names of the page
+        with values_list(), see get_field_lookups.
+
+        :param object_list: objects of the current page
+        :return: list of lookups or None
+        """
+        if not self.projection or not isinstance(object_list, QuerySet):
+            return None
+
+        return self.get_field_lookups()
+
+    def get_rows(self, object_list):
+        """
+        Materializes the rows of the table: for every object the values of the field names,
+        converted with the convert_field_values methods. The template then only has to
+        iterate plain lists.
+
+        With projection, the objects are dicts with the field names and pk instead of model instances.
+
+        :param object_list: objects of the current page
+        :return: list with (object, list of cell values) tuples
+        """
+        field_names = self.get_field_names()
+        projection = self.get_projection(object_list)
+
+        if projection:
+            items = []
+            for values in object_list.prefetch_related(None).values_list('pk', *projection):
+                obj = dict(zip(field_names, values[1:]))
+                obj['pk'] = values[0]
+                items.append((obj, list(values[1:])))
+        else:
+            accessors = self.get_field_accessors()
+            getters = [accessors[field_name] for field_name in field_names]
+            items = ((obj, [getter(obj) for getter in getters]) for obj in object_list)
+
+        field_converters = self.get_field_converters()
+        converters = [(index, field_converters[field_name]) for index, field_name in enumerate(field_names)
+                      if field_name in field_converters]
+
+        rows = []
+        for obj, cells in items:
+            for index, (method_name, method) in converters:
+                try:
+                    cells[index] = method(cells[index])
+                except Exception as e:
+                    if settings.DEBUG:
+                        cells[index] = 'Error parsing {}: {}'.format(method_name, e)
+                    else:
+                        cells[index] = ''
+            rows.append((obj, cells))
+
+        return rows
+
     def get_order_fields(self):
         """
         Return the field names defined in order_fields attribute.
@@ -98,7 +511,8 @@ class DynamicListView(ListView):
     def get_search_fields(self):
         """
         Hook to returns all the fields where can be searched in. The fields shall
-        be suffixed with __icontains in the query
+        be suffixed with __icontains in the query, unless they are prefixed with
+        ^ (istartswith) or = (iexact)
 
         :return: All the field where can be searched in
         """
@@ -125,60 +539,214 @@ class DynamicListView(ListView):
         :return:
         """
 
-        return self.request.GET.get('paginate_by', self.paginate_by)
+        return self.list_state.paginate_by
+
+    def use_keyset_pagination(self, queryset):
+        """
+        Determines if the list is paginated with keyset pagination. When keyset_threshold is set,
+        lists with at most that many items keep the page numbers. This is checked with a COUNT
+        that is limited to keyset_threshold + 1 rows.
+
+        :param queryset: queryset to paginate
+        :return: boolean
+        """
+        if not self.keyset_pagination:
+            return False
+
+        if self.keyset_threshold:
+            return queryset[:self.keyset_threshold + 1].count() > self.keyset_threshold
+
+        return True
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginates with the KeysetPaginator when keyset pagination is used, else
+        the count, the rows and the filter options are retrieved with the query runner
+        """
+        if not self.use_keyset_pagination(queryset):
+            return self.paginate_queryset_with_runner(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size, self.order_by)
+        page = paginator.page(self.list_state.cursor)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_query_runner(self):
+        """
+        Returns the runner that evaluates the independent read queries of the list: the count,
+        the rows of the page and the filter options. See the runners module.
+
+        :return: runner
+        """
+        return self.query_runner or SequentialRunner()
+
+    def get_page_number(self):
+        """
+        Returns the requested page number, or None when it is 'last' or invalid
+
+        :return: int or None
+        """
+        page = self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg) or 1
+        try:
+            return int(page)
+        except ValueError:
+            return None
+
+    def use_filter_values(self):
+        """
+        Determines if the filter values are part of the response
+
+        :return: boolean
+        """
+        if self.use_json_response():
+            return bool(self.request.GET.get('filter_values'))
+
+        fragment_cache = self.get_fragment_cache()
+        return not (fragment_cache and fragment_cache.has('filters'))
+
+    def get_list_queries(self, paginator, queryset, page_number):
+        """
+        Returns the read queries of a page that don't depend on each other: the count, the rows of
+        the page (sliced without waiting for the count) and the options of the filters
+
+        :return: OrderedDict with name -> callable
+        """
+        bottom = (page_number - 1) * paginator.per_page
+        queries = OrderedDict([
+            ('count', lambda: paginator.count),
+            ('rows', partial(self.get_rows, queryset[bottom:bottom + paginator.per_page])),
+        ])
+
+        if self.use_filter_values():
+            for filter_key, query in self.get_filter_option_queries().items():
+                queries['filter-{}'.format(filter_key)] = query
+
+        return queries
+
+    def paginate_queryset_with_runner(self, queryset, page_size):
+        """
+        Paginates like the normal listview, but the count, page and filter queries are evaluated
+        together by the query runner. The rows of the page are kept in page_rows, the filter
+        options in prefetched_filter_options.
+        """
+        paginator = self.get_paginator(queryset, page_size, orphans=self.get_paginate_orphans(),
+                                       allow_empty_first_page=self.get_allow_empty())
+        page_number = self.get_page_number()
+        if page_number is None or page_number < 1 or paginator.orphans:
+            return super(DynamicListView, self).paginate_queryset(queryset, page_size)
+
+        results = self.get_query_runner().run(self.get_list_queries(paginator, queryset, page_number))
+        self.prefetched_filter_options = {name[len('filter-'):]: options for name, options in results.items()
+                                          if name.startswith('filter-')}
+
+        try:
+            page = paginator.page(page_number)
+        except InvalidPage as e:
+            raise Http404(_('Invalid page (%(page_number)s): %(message)s') % {
+                'page_number': page_number,
+                'message': str(e)
+            })
+
+        self.page_rows = results['rows']
+        page.object_list = [obj for obj, cells in self.page_rows]
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_page_rows(self, object_list):
+        """
+        Returns the rows of the page, retrieved while paginating or else from the object list
+
+        :param object_list: objects of the current page
+        :return: list with (object, list of cell values) tuples
+        """
+        if self.page_rows is not None:
+            return self.page_rows
+        return self.get_rows(object_list)
+
+    def get_count_strategy(self):
+        """
+        Hook for returning the strategy used to count the items of the list, e.g.
+        CachedCount(timeout=300) or EstimatedCount(threshold=100000) from the counts module.
+        By default the items are counted exactly.
+
+        :return: count strategy
+        """
+        return self.count_strategy
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """
+        Passes the count strategy to the paginator
+        """
+        if issubclass(self.paginator_class, CountPaginator):
+            kwargs.setdefault('count_strategy', self.get_count_strategy())
+            kwargs.setdefault('view', self)
+
+        return super(DynamicListView, self).get_paginator(queryset, per_page, orphans, allow_empty_first_page,
+                                                          **kwargs)
+
+    def get_cursor_params(self):
+        """
+        The GET parameters of the current request without the cursor and page, used
+        to build the next and previous links of keyset pagination
+
+        :return: urlencoded string
+        """
+        params = self.request.GET.copy()
+        for param in ('cursor', 'page'):
+            params.pop(param, None)
+        return params.urlencode()
 
     @property
     def search_phrase(self):
         """
-        Propery method to determine the search phrase.
+        Propery method to determine the search phrase, as parsed in the list state.
 
         :return: string search phrase
         """
-        if self.request.GET.get('search_phrase') or self.request.GET.get('search_phrase') == '':
-            return self.request.GET.get('search_phrase')
+        return self.list_state.search_phrase
 
-        return ''
+    def get_search_backend(self):
+        """
+        Hook for returning the backend used to search, e.g. PostgresFullTextSearch(rank=True)
+        from the search module. By default an OR of __icontains lookups is used.
+
+        :return: search backend
+        """
+        return self.search_backend or IContainsSearch()
 
     def add_queryset_search(self, queryset):
         """
-        Modifies the query set with the search parameter.
-        Creates an OR filter argument for every self.search_fields with the searchphrase.
+        Modifies the query set with the search parameter, using the search backend.
 
         :param queryset: current queryset
         :return: modified queryset
         """
         if self.search_phrase:
-            queries = [Q(**{'{}__{}'.format(search_field, 'icontains'): self.search_phrase}) for search_field in
-                       self.get_search_fields()]
+            queryset = self.get_search_backend().search(queryset, self.get_search_fields() or [], self.search_phrase)
 
-            # Set up the query
-            query = Q()
+        return queryset
 
-            # Or the Q object with the ones remaining in the list
-            for item in queries:
-                query |= item
+    def add_queryset_rank(self, queryset):
+        """
+        Orders on the relevance of the search results when the search backend ranks them. It is
+        applied after add_queryset_distinct, which would lose the rank.
 
-            queryset = queryset.filter(query)
+        :param queryset: searched, filtered and distinct queryset
+        :return: modified queryset
+        """
+        if self.search_phrase:
+            queryset = self.get_search_backend().add_rank(queryset, self.get_search_fields() or [],
+                                                          self.search_phrase, aggregate=self.needs_distinct())
 
         return queryset
 
     @property
     def order_by(self):
         """
-        Propery method to determine the order by.
+        Propery method to determine the order by, as parsed in the list state.
         First check if it is used in the url, then retrieve the user setting and else it is an empty string
 
         :return: string order by
         """
-        order_by = self.request.GET.get('order_by', None)
-        if order_by in self.get_field_names():
-            if order_by in self.get_order_fields():
-                if self.request.GET.get('sort') == 'DESC':
-                    return '-%s' % order_by
-                else:
-                    return order_by
-
-        return ''
+        return self.list_state.order_by
 
     def add_queryset_ordering(self, query_set):
         """
@@ -210,50 +778,271 @@ class DynamicListView(ListView):
         """
         return self.filter_fields or []
 
+    def get_filter_limit(self, filter_key):
+        """
+        Returns the maximum number of values shown in the dropdown of a filter.
+        First tries filter_limits (a dict with filter key -> limit), then filter_limit.
+
+        :param filter_key: filter key (e.g. author__pk)
+        :return: int or None for no limit
+        """
+        if self.filter_limits and filter_key in self.filter_limits:
+            return self.filter_limits[filter_key]
+        if self.use_lazy_filter(filter_key):
+            return self.filter_options_limit
+        return self.filter_limit
+
+    def use_lazy_filter(self, filter_key):
+        """
+        Determines if the options of a filter are loaded on demand (type-ahead) instead of
+        rendered in the page. filter_lazy can be True for all the filters, or a list of filter keys.
+
+        :param filter_key: filter key (e.g. author__pk)
+        :return: boolean
+        """
+        if self.filter_lazy is True:
+            return True
+        return bool(self.filter_lazy) and filter_key in self.filter_lazy
+
+    def get_filter_options_url(self):
+        """
+        Returns the url the lazy filters load their options from, the list itself when
+        filter_options_url is not set
+
+        :return: url
+        """
+        if self.filter_options_url:
+            return self.filter_options_url
+        return self.request.path
+
+    def get_filter_options_request(self):
+        """
+        Returns the lazy filter the options are requested for with the filter_options GET parameter
+
+        :return: tuple (filter_key, filter_name) or None
+        """
+        filter_key = self.request.GET.get('filter_options')
+        if not filter_key or not self.use_lazy_filter(filter_key):
+            return None
+
+        for filter_field in self.get_filter_fields():
+            if filter_field[0] == filter_key:
+                return filter_field
+        return None
+
+    def get_filter_options_data(self, filter_key, filter_name):
+        """
+        Returns the options of a lazy filter whose name starts with the term GET parameter,
+        limited to get_filter_limit, as data for a JSON response
+
+        :param filter_key: filter key (e.g. author__pk)
+        :param filter_name: filter name (e.g. author__name)
+        :return: dict
+        """
+        term = self.request.GET.get('term', '')
+        queryset = self.get_filter_queryset()
+        if term:
+            queryset = queryset.filter(**{'{}__istartswith'.format(filter_name): term})
+
+        return {
+            'filter': filter_key,
+            'term': term,
+            'options': self.get_filter_options(queryset, filter_key, filter_name),
+        }
+
+    def get_filter_selected_name(self, queryset, filter_key, filter_name):
+        """
+        Returns the name of the selected value of a lazy filter, as its options are not retrieved
+
+        :param queryset: queryset from get_filter_queryset
+        :param filter_key: filter key (e.g. author__pk)
+        :param filter_name: filter name (e.g. author__name)
+        :return: name or None
+        """
+        sel_key = self.filter_kwargs.get(filter_key)
+        if not sel_key:
+            return None
+
+        names = queryset.filter(**{filter_key: sel_key}).values_list(filter_name, flat=True)[:1]
+        return names[0] if names else None
+
+    def get_filter_queryset(self):
+        """
+        The queryset the filter values are retrieved from. It is searched, filtered and
+        annotated like the list, but without ordering, distinct and related loading, as the
+        filter values are grouped anyway.
+
+        :return: queryset
+        """
+        queryset = self.get_base_queryset()
+        queryset = self.add_queryset_search(queryset)
+        queryset = self.add_queryset_filtering(queryset)
+        queryset = self.add_queryset_annotating(queryset)
+        return queryset.order_by()
+
+    def get_filter_options(self, queryset, filter_key, filter_name):
+        """
+        Queries the distinct values of one filter, sorted on the filter_name.
+        When filter_counts is set, every value gets the number of items as third element.
+
+        :param queryset: queryset from get_filter_queryset
+        :param filter_key: filter key (e.g. author__pk)
+        :param filter_name: filter name (e.g. author__name)
+        :return: list with (key, name) or (key, name, count) tuples
+        """
+        options = queryset.values_list(filter_key, filter_name)
+
+        if self.filter_counts:
+            options = options.annotate(filter_count=Count('pk', distinct=True))
+        else:
+            options = options.distinct()
+
+        options = options.order_by(filter_name, filter_key)
+
+        limit = self.get_filter_limit(filter_key)
+        if limit:
+            options = options[:limit]
+
+        return list(options)
+
+    def use_filter_cache(self, filter_key):
+        """
+        Determines if the values of a filter are cached. filter_cache can be True
+        to cache all the filters, or a list of filter keys.
+
+        :param filter_key: filter key (e.g. author__pk)
+        :return: boolean
+        """
+        if self.filter_cache is True:
+            return True
+        return bool(self.filter_cache) and filter_key in self.filter_cache
+
+    def get_filter_cache_keys(self):
+        """
+        Returns the cache keys of the cached filters. The keys contain the view, the filter, the
+        normalized search and filter state and the versions of the listed model and all the related
+        models of the field paths, so they are invalidated when one of them is saved or deleted.
+
+        :return: dict with filter key -> cache key
+        """
+        filter_fields = [filter_field for filter_field in self.get_filter_fields()
+                         if self.use_filter_cache(filter_field[0]) and not self.use_lazy_filter(filter_field[0])]
+        if not filter_fields:
+            return {}
+
+        base = (
+            self.__class__.__module__, self.__class__.__name__, self.get_queryset_model()._meta.label,
+            self.list_state.normalized(ordering=False, pagination=False), self.filter_counts,
+            tuple(get_model_versions(self.get_query_plan().models)),
+        )
+        return {filter_key: self.get_filter_cache_key(base, filter_key, filter_name)
+                for filter_key, filter_name in filter_fields}
+
+    def get_filter_cache_key(self, base, filter_key, filter_name):
+        """
+        Returns the cache key of the options of a filter. The options are shared by all the users,
+        when the queryset of the view differs per user add the user to the key.
+
+        :param base: tuple with the view, list state and model versions
+        :param filter_key: filter key (e.g. author__pk)
+        :param filter_name: field path of the option labels
+        :return: string cache key
+        """
+        return make_key('django_dynamic_views.filter', base, filter_key, filter_name, self.get_filter_limit(filter_key))
+
+    def get_cached_filter_options(self):
+        """
+        Retrieves the options of the cached filters with one get_many, once per request
+
+        :return: tuple (dict with filter key -> cache key, dict with filter key -> cached options)
+        """
+        if getattr(self, '_cached_filter_options', None) is None:
+            cache_keys = self.get_filter_cache_keys()
+            cached = get_cache().get_many(list(cache_keys.values())) if cache_keys else {}
+            self._cached_filter_options = (cache_keys, {
+                filter_key: cached[cache_key] for filter_key, cache_key in cache_keys.items() if cache_key in cached
+            })
+        return self._cached_filter_options
+
+    def get_filter_option_queries(self):
+        """
+        Returns the queries of the filter options that are not lazy and not cached
+
+        :return: OrderedDict with filter key -> callable
+        """
+        queryset = self.get_filter_queryset()
+        cached = self.get_cached_filter_options()[1]
+        queries = OrderedDict()
+
+        for filter_key, filter_name in self.get_filter_fields():
+            if not self.use_lazy_filter(filter_key) and filter_key not in cached:
+                queries[filter_key] = partial(self.get_filter_options, queryset, filter_key, filter_name)
+
+        return queries
+
     def get_filter_values(self):
         """
-        Queries the database for the values that shall be used in the filtering dropdowns
+        Queries the database for the values that shall be used in the filtering dropdowns.
+        Cached filters are retrieved from the cache without queries, lazy filters only get
+        the name of their selected value. The queries are evaluated by the query runner,
+        unless they were already evaluated while paginating.
 
         :returns list with tuples with the first argument the filter key and the second the value used for
         displaying in the UI
         """
         filter_values = []
+        queryset = self.get_filter_queryset()
+        verbose_names = self.get_field_verbose_names()
+
+        cache_keys, options = self.get_cached_filter_options()
+        options = dict(options)
+        prefetched = self.prefetched_filter_options or {}
+        queries = OrderedDict((filter_key, query) for filter_key, query in self.get_filter_option_queries().items()
+                              if filter_key not in prefetched)
+
+        queried = dict(prefetched)
+        queried.update(self.get_query_runner().run(queries))
+        options.update(queried)
 
         for filter_key, filter_name in self.get_filter_fields():
-            values = [(o[filter_key], o[filter_name]) for o in
-                      self.get_queryset().values(filter_key, filter_name).order_by(filter_key)]
+            if self.use_lazy_filter(filter_key):
+                selected_verbose = self.get_filter_selected_name(queryset, filter_key, filter_name)
+                filter_values.append(
+                    (filter_key, verbose_names.get(filter_name, filter_name), [], selected_verbose or '')
+                )
+                continue
 
-            values.sort(key=lambda tup: tup[1])  # Sort on the filter_name
+            values = options[filter_key]
 
             sel_key = self.filter_kwargs.get(filter_key, '')
             selected_verbose = ''
             if sel_key:
-                selected_verbose = dict(values).get(sel_key)
+                names = {value[0]: value[1] for value in values}
+                selected_verbose = names.get(sel_key)
                 if not selected_verbose:
                     try:
-                        selected_verbose = dict(values).get(int(sel_key))
-                    except Exception as e:
+                        selected_verbose = names.get(int(sel_key))
+                    except ValueError:
                         pass
 
             filter_values.append(
-                (filter_key, self.verbose_names.get(filter_name), values, selected_verbose)
+                (filter_key, verbose_names.get(filter_name, filter_name), values, selected_verbose)
             )
 
+        to_cache = {cache_keys[filter_key]: values for filter_key, values in queried.items()
+                    if filter_key in cache_keys}
+        if to_cache:
+            get_cache().set_many(to_cache, self.filter_cache_timeout)
+
         return filter_values
 
     @property
     def filter_kwargs(self):
         """
-        Helper method to create the keyword arguments used in the queryset to actual filter the list
+        Helper method to return the keyword arguments used in the queryset to actual filter the list,
+        as parsed in the list state
         """
-        filter_kwargs = {}
-
-        for filter_key, filter_name in self.get_filter_fields():
-            filter_value = self.request.GET.get('filter-{}'.format(filter_key))
-            if filter_value and filter_value != '---':
-                filter_kwargs[filter_key] = str(filter_value)
-
-        return filter_kwargs
+        return self.list_state.filter_kwargs
 
     def add_queryset_filtering(self, queryset):
         """
@@ -268,26 +1057,105 @@ class DynamicListView(ListView):
 
         return queryset
 
+    def needs_distinct(self):
+        """
+        Determines if the searching or filtering of the current request joins a reverse foreign key
+        or many to many relation, which can return the same item more than once.
+
+        :return: boolean
+        """
+        if not self.distinct:
+            return False
+
+        paths = list(self.filter_kwargs)
+        if self.search_phrase:
+            paths.extend(self.get_search_backend().search_paths(self.get_search_fields() or []))
+
+        return self.get_query_plan().multi_valued(paths)
+
+    def add_queryset_distinct(self, queryset):
+        """
+        Removes duplicate items when needed. Instead of a SELECT DISTINCT over all the selected
+        columns, the searched and filtered queryset is used as a pk__in subquery.
+
+        :param queryset: searched and filtered queryset
+        :return: modified queryset
+        """
+        if self.needs_distinct():
+            queryset = self.get_base_queryset().filter(pk__in=queryset.values('pk'))
+
+        return queryset
+
     def add_queryset_annotating(self, queryset):
         if self.annotate_fields:
             queryset = queryset.annotate(**self.annotate_fields)
 
         return queryset
 
+    def get_query_plan(self):
+        """
+        Returns the query plan for the field names, search fields, filter fields and order fields
+        of this view. Plans are cached per model and configuration.
+
+        :return: QueryPlan
+        """
+        return QueryPlan.for_model(
+            self.get_queryset_model(),
+            field_names=self.get_field_names(),
+            search_fields=self.get_search_backend().search_paths(self.get_search_fields() or []),
+            filter_fields=self.get_filter_fields(),
+            order_fields=self.get_order_fields(),
+        )
+
+    def get_base_queryset(self):
+        """
+        Returns the queryset of the view (model or queryset) on the read database
+
+        :return: queryset
+        """
+        return self.use_read_database(super(DynamicListView, self).get_queryset())
+
+    def get_queryset_model(self):
+        """
+        Returns the model of the list, also when only a queryset is defined on the view
+
+        :return: model class
+        """
+        if self.model:
+            return self.model
+        return self.queryset.model
+
+    def add_queryset_planning(self, queryset):
+        """
+        Modifies the queryset with select_related for forward foreign key chains,
+        prefetch_related for reverse and many to many paths and, when plan_only is set,
+        only() for the columns the page renders.
+
+        When a field name is a method or property of the listed model, only() is not applied
+        because it could access any field.
+
+        :param queryset: current queryset
+        :return: modified queryset
+        """
+        if self.plan_related:
+            queryset = self.get_query_plan().apply(queryset, only=self.plan_only)
+
+        return queryset
+
     def get_queryset(self):
         """
         Modifies the query set with all the magic this class contains
         We will add searching, ordering and filtering, as well add distinct and
         prefetch related to the queryset
         """
-        queryset = super(DynamicListView, self).get_queryset()
+        queryset = self.get_base_queryset()
         queryset = self.add_queryset_search(queryset)
         queryset = self.add_queryset_filtering(queryset)
+        queryset = self.add_queryset_distinct(queryset)
+        queryset = self.add_queryset_rank(queryset)
         queryset = self.add_queryset_annotating(queryset)
         queryset = self.add_queryset_ordering(queryset)
-
-        if self.distinct:
-            queryset = queryset.distinct()
+        queryset = self.add_queryset_planning(queryset)
 
         if self.prefetch_related:
             queryset = queryset.prefetch_related(*self.prefetch_related)
@@ -316,31 +1184,95 @@ class DynamicListView(ListView):
             page_range = range(start, end)
         return page_range
 
+    def uses_model_versions(self):
+        """
+        Determines if something of the list is cached with the model versions, those models have to be in
+        the DYNAMIC_VIEWS_CACHED_MODELS setting
+
+        :return: boolean
+        """
+        count_strategy = self.get_count_strategy()
+        return bool(self.fragment_cache or self.filter_cache or
+                    getattr(count_strategy, 'uses_model_versions', False))
+
+    def get_fragment_cache_keys(self):
+        """
+        Returns the cache keys of the rendered table and filter dropdowns. The keys contain the
+        path, view, field names, language, the normalized list state and the versions of the listed
+        model and all the related models of the field paths. A version changes when an instance of
+        the model is saved or deleted, so the cached fragments are invalidated automatically.
+
+        When the list differs per user, add the user to the keys.
+
+        :return: dict with fragment name -> cache key
+        """
+        base = (
+            self.request.path, self.__class__.__module__, self.__class__.__name__, tuple(self.get_field_names()),
+            get_language(), tuple(get_model_versions(self.get_query_plan().models)),
+        )
+        return {
+            'table': make_key('django_dynamic_views.fragment', 'table', base, self.list_state.normalized()),
+            'filters': make_key('django_dynamic_views.fragment', 'filters', base,
+                                self.list_state.normalized(ordering=False, pagination=False)),
+        }
+
+    def get_fragment_cache(self):
+        """
+        Returns the cached fragments of the current request when fragment_cache is set
+
+        :return: FragmentCache or None
+        """
+        if not self.fragment_cache:
+            return None
+
+        if getattr(self, '_fragment_cache', None) is None:
+            self._fragment_cache = FragmentCache(self.get_fragment_cache_keys(), self.fragment_cache_timeout)
+        return self._fragment_cache
+
     def get_context_data(self, **kwargs):
-        context = super(DynamicListView, self).get_context_data(**kwargs)
+        fragment_cache = self.get_fragment_cache()
+
+        if fragment_cache and fragment_cache.has('table'):
+            # No need to count and retrieve the page
+            context = super(MultipleObjectMixin, self).get_context_data(**kwargs)
+        else:
+            context = super(DynamicListView, self).get_context_data(**kwargs)
+            context['rows'] = self.get_page_rows(context['object_list'])
+            if isinstance(context['paginator'], KeysetPaginator):
+                context['keyset_pagination'] = True
+                context['cursor_params'] = self.get_cursor_params()
+            elif context['paginator']:
+                context['nice_page_range'] = self.nice_page_range(context['paginator'].page_range,
+                                                                  context['page_obj'].number)
+
+        if self.use_filter_values():
+            context['filter_values'] = self.get_filter_values()
+
+        context['fragment_cache'] = fragment_cache
         context['field_names'] = self.get_field_names()
         context['field_verbose_names'] = self.get_field_verbose_names()
         context['order_fields'] = self.get_order_fields()
         context['convert_field_values'] = self.get_convert_field_values()
         context['filter_fields'] = self.get_filter_fields()
-        context['filter_values'] = self.get_filter_values()
+        context['filter_counts'] = self.filter_counts
+        context['lazy_filters'] = [filter_key for filter_key, filter_name in self.get_filter_fields()
+                                   if self.use_lazy_filter(filter_key)]
+        if context['lazy_filters']:
+            context['filter_options_url'] = self.get_filter_options_url()
         context['filter_kwargs'] = self.filter_kwargs
         context['num_fields'] = len(self.get_field_names())
         context['paginate_url'] = self.get_paginate_url
         context['search'] = True if self.get_search_fields() else False
         context['search_phrase'] = self.search_phrase
-        if context['paginator']:
-            context['nice_page_range'] = self.nice_page_range(context['paginator'].page_range,
-                                                              context['page_obj'].number)
 
         if self.order_by:
-            context['order_by'] = self.order_by[1:] if self.order_by[0] == '-' else self.order_by
+            context['order_by'] = self.list_state.order_field
             context['sort'] = 'ASC' if self.order_by[0] == '-' else 'DESC'
 
         return context
 
 
-class AdminDynamicListView(DynamicListView):
+class AdminDynamicListView(PrimaryPinMixin, DynamicListView):
     template_name = 'django_dynamic_views/admin_dynamic_list_view.html'
     title = None
 
@@ -350,13 +1282,18 @@ class AdminDynamicListView(DynamicListView):
     read_link = None
     update_link = None
     delete_link = None
+    export_link = None
+    import_link = None
+    bulk_actions = []
+    bulk_update_fields = None
+    bulk_chunk_size = 1000
 
     @property
     def link_names(self):
         return {link: 'get_{}_link'.format(link) for link in self.links}
 
     def object_links(self):
-        return [link for link in self.links if link not in ('create', 'list', )]
+        return [link for link in self.links if link not in ('create', 'list', 'export', 'import', )]
 
     def get_update_link(self):
         if self.update_link:
@@ -382,6 +1319,18 @@ class AdminDynamicListView(DynamicListView):
         else:
             return False
 
+    def get_export_link(self):
+        if self.export_link:
+            return self.export_link
+        else:
+            return False
+
+    def get_import_link(self):
+        if self.import_link:
+            return self.import_link
+        else:
+            return False
+
     def get_title(self):
         if self.title:
             return self.title
@@ -394,8 +1343,181 @@ class AdminDynamicListView(DynamicListView):
         else:
             return 'New'
 
+    def get_bulk_actions(self):
+        """
+        Returns the actions that can be run on the selected items, 'delete' and/or 'update'
+
+        :return: list of action names
+        """
+        return self.bulk_actions or []
+
+    def get_bulk_update_fields(self):
+        """
+        Returns the model fields that can be set on the selected items with the update action
+
+        :return: list of field names
+        """
+        return self.bulk_update_fields or []
+
+    def get_bulk_queryset(self):
+        """
+        Returns the items a bulk action is run on: the checked items, or all the items matching
+        the current search and filters when select_across is posted. Only items of the list can be selected.
+        The items are changed on the primary database.
+
+        :return: queryset
+        :raises ValidationError: when a posted primary key is invalid
+        """
+        queryset = self.get_filter_queryset()
+        queryset = queryset.using(router.db_for_write(queryset.model))
+        if self.request.POST.get('select_across'):
+            return queryset
+
+        to_python = self.get_queryset_model()._meta.pk.to_python
+        pks = [to_python(pk) for pk in self.request.POST.getlist('pk')]
+        return queryset.filter(pk__in=pks)
+
+    def get_bulk_chunks(self, queryset):
+        """
+        Splits the queryset in ranges of at most bulk_chunk_size primary keys, so every
+        statement only locks a part of the table
+
+        :param queryset: items of the bulk action
+        :return: generator of querysets
+        """
+        queryset = queryset.order_by('pk')
+        lower = None
+
+        while True:
+            chunk = queryset if lower is None else queryset.filter(pk__gt=lower)
+            upper = list(chunk.values_list('pk', flat=True)[self.bulk_chunk_size - 1:self.bulk_chunk_size])
+            if not upper:
+                yield chunk
+                return
+
+            yield chunk.filter(pk__lte=upper[0])
+            lower = upper[0]
+
+    def bulk_delete(self, queryset):
+        """
+        Deletes the items, one transaction per chunk
+
+        :param queryset: items of the bulk action
+        :return: number of deleted items (without the cascaded items)
+        """
+        label = queryset.model._meta.label
+        count = 0
+        for chunk in self.get_bulk_chunks(queryset):
+            with transaction.atomic(using=chunk.db):
+                count += chunk.delete()[1].get(label, 0)
+        bump_model_version(queryset.model)
+        return count
+
+    def bulk_update(self, queryset, values):
+        """
+        Sets the values on the items with an UPDATE statement per chunk, one transaction per chunk.
+        As update doesn't send signals, the cached lists of the model are invalidated afterwards.
+
+        :param queryset: items of the bulk action
+        :param values: dict with field name -> value
+        :return: number of updated items
+        """
+        count = 0
+        for chunk in self.get_bulk_chunks(queryset):
+            with transaction.atomic(using=chunk.db):
+                count += chunk.update(**values)
+
+        bump_model_version(queryset.model)
+        return count
+
+    def get_bulk_update_values(self):
+        """
+        Validates the posted bulk_field and bulk_value with a ModelForm of that field
+
+        :return: tuple (dict with field name -> value or None, errors)
+        """
+        field_name = self.request.POST.get('bulk_field')
+        if field_name not in self.get_bulk_update_fields():
+            return None, 'Unknown field'
+
+        form_class = modelform_factory(self.get_queryset_model(), fields=[field_name])
+        form = form_class(data={field_name: self.request.POST.get('bulk_value', '')})
+        if not form.is_valid():
+            return None, form.errors.as_text()
+
+        return {field_name: form.cleaned_data[field_name]}, None
+
+    def post(self, request, *args, **kwargs):
+        """
+        Runs the posted bulk_action on the selected items and redirects back to the list
+        """
+        action = request.POST.get('bulk_action')
+        if action not in self.get_bulk_actions():
+            return HttpResponseBadRequest('Unknown action')
+
+        try:
+            queryset = self.get_bulk_queryset()
+        except ValidationError:
+            return HttpResponseBadRequest('Invalid selection')
+
+        if action == 'delete':
+            self.bulk_count = self.bulk_delete(queryset)
+        else:
+            values, errors = self.get_bulk_update_values()
+            if errors:
+                return HttpResponseBadRequest(errors)
+            self.bulk_count = self.bulk_update(queryset, values)
+
+        return HttpResponseRedirect(request.get_full_path())
+
+    def get_current_app(self):
+        """
+        Returns the application namespace the object links are reversed in, like the url template tag
+
+        :return: current app or None
+        """
+        current_app = getattr(self.request, 'current_app', None)
+        if current_app is None:
+            resolver_match = getattr(self.request, 'resolver_match', None)
+            current_app = resolver_match.namespace if resolver_match else None
+        return current_app
+
+    def get_link_patterns(self):
+        """
+        Returns the url patterns of the object links, reversed once per request
+
+        :return: list of (link, LinkPattern or None) tuples
+        """
+        current_app = self.get_current_app()
+        link_patterns = []
+        for link in self.object_links():
+            viewname = getattr(self, self.link_names[link])()
+            link_patterns.append((link, LinkPattern(viewname, current_app) if viewname else None))
+        return link_patterns
+
+    def add_row_links(self, rows):
+        """
+        Adds the urls of the object links to the rows
+
+        :param rows: list of (object, cells) tuples
+        :return: list of (object, cells, list of (link, url)) tuples
+        """
+        link_patterns = self.get_link_patterns()
+        rows_with_links = []
+
+        for obj, cells in rows:
+            pk = obj['pk'] if isinstance(obj, dict) else obj.pk
+            links = [(link, pattern(pk) if pattern else None) for link, pattern in link_patterns]
+            rows_with_links.append((obj, cells, links))
+
+        return rows_with_links
+
     def get_context_data(self, **kwargs):
         context = super(AdminDynamicListView, self).get_context_data(**kwargs)
+        if 'rows' in context:
+            context['rows'] = self.add_row_links(context['rows'])
+        context['bulk_actions'] = self.get_bulk_actions()
+        context['bulk_update_fields'] = self.get_bulk_update_fields()
         context['links'] = self.links
         context['object_links'] = self.object_links
         context['link_names'] = self.link_names
@@ -403,12 +1525,15 @@ class AdminDynamicListView(DynamicListView):
         context['read_link'] = self.get_read_link()
         context['update_link'] = self.get_update_link()
         context['delete_link'] = self.get_delete_link()
+        context['export_link'] = self.get_export_link()
+        context['export_params'] = self.get_cursor_params()
+        context['import_link'] = self.get_import_link()
         context['title'] = self.get_title()
         context['create_text'] = self.get_create_text()
         return context
 
 
-class DynamicReadView(DetailView):
+class DynamicReadView(ReadDatabaseMixin, DetailView):
     template_name = 'django_dynamic_views/dynamic_read_view.html'
     field_names = None
     verbose_names = None
@@ -440,6 +1565,9 @@ class DynamicReadView(DetailView):
 
             return field_verbose_names
 
+    def get_queryset(self):
+        return self.use_read_database(super(DynamicReadView, self).get_queryset())
+
     def get_context_data(self, **kwargs):
         context = super(DynamicReadView, self).get_context_data(**kwargs)
         context['field_names'] = self.get_field_names()
@@ -447,23 +1575,39 @@ class DynamicReadView(DetailView):
         return context
 
 
-class DynamicDeleteView(DeleteView):
+class DynamicDeleteView(PrimaryPinMixin, DeleteView):
     template_name = 'django_dynamic_views/dynamic_delete_form.html'
+    delete_sample_size = 10
+
+    def get_delete_using(self):
+        """
+        Returns the database alias the object is deleted from, the way Model.delete determines it
+
+        :return: database alias
+        """
+        return router.db_for_write(self.object.__class__, instance=self.object)
+
+    def get_delete_counts(self):
+        """
+        Counts the items that are deleted with the object per model, with a sample of
+        at most delete_sample_size items per model. The items are not all loaded in memory.
+
+        :return: list of (model, count, sample list) tuples
+        """
+        counter = DeleteCounter(using=self.get_delete_using())
+        return counter.count(self.object, sample_size=self.delete_sample_size)
 
     def get_context_data(self, **kwargs):
         context = super(DynamicDeleteView, self).get_context_data(**kwargs)
 
-        collector = Collector(using='default') # or specific database
-        collector.collect([self.object])
-        to_delete = collector.instances_with_model()
-        context['to_delete_list'] = []
-
-        for x, y in to_delete:
-            context['to_delete_list'].append((x.__name__, y,))
+        delete_counts = self.get_delete_counts()
+        context['to_delete_counts'] = [(model.__name__, count, samples) for model, count, samples in delete_counts]
+        context['to_delete_list'] = [(model.__name__, samples) for model, count, samples in delete_counts]
 
         return context
 
-class DynamicUpdateView(UpdateView):
+
+class DynamicUpdateView(PrimaryPinMixin, UpdateView):
     template_name = 'django_dynamic_views/dynamic_form.html'
     field_names = None
 
@@ -472,7 +1616,7 @@ class DynamicUpdateView(UpdateView):
         return self.field_names
 
 
-class DynamicCreateView(CreateView):
+class DynamicCreateView(PrimaryPinMixin, CreateView):
     template_name = 'django_dynamic_views/dynamic_form.html'
     field_names = None
 
@@ -481,12 +1625,177 @@ class DynamicCreateView(CreateView):
         return self.field_names
 
 
-class DynamicCRUDView(object):
+class DynamicImportView(PrimaryPinMixin, FormView):
+    """
+    Imports a CSV or JSON Lines upload, the columns are mapped onto the field names.
+
+    Every row is validated with a form of the field names, the valid rows are inserted with
+    bulk_create in batches of import_batch_size, one transaction per batch. The invalid rows are
+    reported with their line number. When a batch fails in the database (e.g. a unique constraint)
+    its rows are inserted one by one, so every failing row is reported. As bulk_create doesn't call
+    save() or send signals, the cached lists of the model are invalidated afterwards.
+    """
+    template_name = 'django_dynamic_views/dynamic_import_form.html'
+    form_class = ImportForm
+    model = None
+    field_names = None
+    verbose_names = None
+    import_batch_size = 500
+    import_max_errors = 100
+
+    def get_field_names(self):
+        """
+        Returns the field names that can be imported: the editable model fields of field_names
+
+        :return: list of field names
+        """
+        field_names = []
+        for field_name in self.field_names or []:
+            try:
+                field = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete and field.editable and not field.auto_created and not field.many_to_many:
+                field_names.append(field_name)
+        return field_names
+
+    def get_row_form_class(self):
+        """
+        Returns the form every row is validated with, a valid form has the new item as instance
+
+        :return: ImportRowForm class
+        """
+        return import_row_form_factory(self.model, self.get_field_names())
+
+    def get_import_rows(self, upload, import_format):
+        """
+        Reads the rows of the upload, line by line
+
+        :param upload: uploaded file
+        :param import_format: 'csv' or 'jsonl'
+        :return: generator of (line number, dict with field name -> value or None)
+        """
+        if import_format == 'jsonl':
+            return read_jsonl_rows(upload, self.get_field_names())
+        return read_csv_rows(upload, self.get_field_names(), self.verbose_names)
+
+    def get_import_using(self):
+        return router.db_for_write(self.model)
+
+    def insert_batch(self, objects):
+        """
+        Inserts a batch of new items in one transaction
+
+        :param objects: unsaved model instances
+        """
+        using = self.get_import_using()
+        with transaction.atomic(using=using):
+            self.model._base_manager.using(using).bulk_create(objects, batch_size=self.import_batch_size)
+
+    def import_rows(self, rows):
+        """
+        Validates and inserts the rows
+
+        :param rows: generator of (line number, dict with field name -> value or None)
+        :return: dict with the number of rows, imported rows and errors, and the first
+        import_max_errors errors as (line number, message) tuples
+        """
+        report = {'rows': 0, 'imported': 0, 'error_count': 0, 'errors': []}
+        form_class = self.get_row_form_class()
+        batch = []
+
+        def add_error(line_number, message):
+            report['error_count'] += 1
+            if len(report['errors']) < self.import_max_errors:
+                report['errors'].append((line_number, message))
+
+        def flush():
+            try:
+                self.insert_batch([obj for line_number, obj in batch])
+            except DatabaseError:
+                # Find the failing rows
+                for line_number, obj in batch:
+                    try:
+                        self.insert_batch([obj])
+                    except DatabaseError as e:
+                        add_error(line_number, force_text(e))
+                    else:
+                        report['imported'] += 1
+            else:
+                report['imported'] += len(batch)
+
+        for line_number, data in rows:
+            report['rows'] += 1
+            if data is None:
+                add_error(line_number, 'Invalid line')
+                continue
+
+            form = form_class(data=data)
+            if not form.is_valid():
+                add_error(line_number, form.errors.as_text())
+                continue
+
+            batch.append((line_number, form.instance))
+
+            if len(batch) >= self.import_batch_size:
+                flush()
+                batch = []
+
+        if batch:
+            flush()
+
+        if report['imported']:
+            bump_model_version(self.model)
+
+        return report
+
+    def form_valid(self, form):
+        rows = self.get_import_rows(form.cleaned_data['file'], form.cleaned_data['format'])
+        report = self.import_rows(rows)
+        return self.render_to_response(self.get_context_data(form=form, import_report=report))
+
+    def get_context_data(self, **kwargs):
+        context = super(DynamicImportView, self).get_context_data(**kwargs)
+        context['field_names'] = self.get_field_names()
+        return context
+
+
+ViewConfig = namedtuple('ViewConfig', ['link', 'name', 'regex', 'view'])
+
+
+class DynamicCRUDViewMeta(type):
+    """
+    Registers the DynamicCRUDView classes with a model. Classes without a model are bases for other classes.
+    The views are built on the first get_view()/urls() call, not when the module is imported.
+    """
+
+    def __new__(mcs, name, bases, attrs):
+        cls = super(DynamicCRUDViewMeta, mcs).__new__(mcs, name, bases, attrs)
+        if cls.model is not None:
+            registry.register(cls)
+        return cls
+
+
+class DynamicCRUDView(six.with_metaclass(DynamicCRUDViewMeta, object)):
     model = None
     links = ['list', 'update', 'read', 'delete', 'create']
 
+    list_view_class = AdminDynamicListView
+    update_view_class = DynamicUpdateView
+    read_view_class = DynamicReadView
+    delete_view_class = DynamicDeleteView
+    create_view_class = DynamicCreateView
+    export_view_class = AdminDynamicListView
+    import_view_class = DynamicImportView
+    filter_options_view_class = AdminDynamicListView
+
     field_names = ['pk']
     verbose_names = None
+    filter_fields = None
+    filter_lazy = False
+    bulk_actions = []
+    bulk_update_fields = None
+    read_using = None
 
     update_kwargs = 'pk'
     update_kwargs_regexp = '(?P<pk>[-\w]+)'
@@ -509,11 +1818,26 @@ class DynamicCRUDView(object):
             if link != 'list':
                 kwargs['{}_link'.format(link)] = self.link_name(link)
 
+        if self.filter_fields:
+            kwargs['filter_fields'] = self.filter_fields
+            kwargs['filter_lazy'] = self.filter_lazy
+            if self.filter_lazy:
+                kwargs['filter_options_url'] = reverse_lazy(self.link_name('filter_options'))
+
+        if self.bulk_actions:
+            kwargs['bulk_actions'] = self.bulk_actions
+            kwargs['bulk_update_fields'] = self.bulk_update_fields
+
+        if self.read_using:
+            kwargs['read_using'] = self.read_using
+
         return kwargs
 
     def get_read_view_kwargs(self):
         kwargs = self.get_view_kwargs()
         kwargs['field_names'] = self.field_names
+        if self.read_using:
+            kwargs['read_using'] = self.read_using
         return kwargs
 
     def get_update_view_kwargs(self):
@@ -528,6 +1852,33 @@ class DynamicCRUDView(object):
         kwargs['success_url'] = reverse_lazy(self.link_name('list'))
         return kwargs
 
+    def get_list_endpoint_kwargs(self):
+        """
+        The kwargs of the views that reuse the list (export, filter options), without the bulk actions,
+        which only the list accepts
+        """
+        kwargs = self.get_list_view_kwargs()
+        kwargs.pop('bulk_actions', None)
+        kwargs.pop('bulk_update_fields', None)
+        return kwargs
+
+    def get_export_view_kwargs(self):
+        kwargs = self.get_list_endpoint_kwargs()
+        kwargs['export_format'] = 'csv'
+        kwargs['export_formats'] = ['csv', 'jsonl']
+        return kwargs
+
+    def get_filter_options_view_kwargs(self):
+        kwargs = self.get_list_endpoint_kwargs()
+        kwargs['filter_options_endpoint'] = True
+        return kwargs
+
+    def get_import_view_kwargs(self):
+        kwargs = self.get_view_kwargs()
+        kwargs['field_names'] = self.field_names
+        kwargs['verbose_names'] = self.verbose_names
+        return kwargs
+
     def get_delete_view_kwargs(self):
         kwargs = self.get_view_kwargs()
         kwargs['success_url'] = reverse_lazy(self.link_name('list'))
@@ -535,23 +1886,35 @@ class DynamicCRUDView(object):
 
     @property
     def list_class(self):
-        return AdminDynamicListView.as_view(**self.get_list_view_kwargs())
+        return self.get_view('list')
 
     @property
     def update_class(self):
-        return DynamicUpdateView.as_view(**self.get_update_view_kwargs())
+        return self.get_view('update')
 
     @property
     def read_class(self):
-        return DynamicReadView.as_view(**self.get_read_view_kwargs())
+        return self.get_view('read')
 
     @property
     def delete_class(self):
-        return DynamicDeleteView.as_view(**self.get_delete_view_kwargs())
+        return self.get_view('delete')
 
     @property
     def create_class(self):
-        return DynamicCreateView.as_view(**self.get_create_view_kwargs())
+        return self.get_view('create')
+
+    @property
+    def export_class(self):
+        return self.get_view('export')
+
+    @property
+    def import_class(self):
+        return self.get_view('import')
+
+    @property
+    def filter_options_class(self):
+        return self.get_view('filter_options')
 
     @property
     def model_name(self):
@@ -560,24 +1923,100 @@ class DynamicCRUDView(object):
     def link_name(self, link_name):
         return '{}_{}'.format(self.model_name, link_name)
 
-    def urls(self):
-        urls = []
-        for link in self.links:
-            if hasattr(self, '{}_link'.format(link)):
-                link_name = getattr(self, '{}_link'.format(link))
-            else:
-                link_name = link
+    def get_links(self):
+        """
+        Returns the links that get a url: the links, and the filter options endpoint
+        when the list has lazy filters
+
+        :return: list of links
+        """
+        links = list(self.links)
+        if 'list' in links and self.filter_fields and self.filter_lazy:
+            links.append('filter_options')
+        return links
+
+    def get_url_regex(self, link):
+        """
+        Returns the url pattern of a link, e.g. ^book/read/(?P<pk>[-\\w]+)/$
 
-            url_check = r'{}/{}/'.format(self.model_name, link_name)
+        :param link: link
+        :return: regex
+        """
+        if link == 'filter_options':
+            # JSON endpoint the type-ahead filter dropdowns load their options from
+            return r'^{}/filter-options/$'.format(self.model_name)
+
+        if hasattr(self, '{}_link'.format(link)):
+            link_name = getattr(self, '{}_link'.format(link))
+        else:
+            link_name = link
+
+        url_check = r'{}/{}/'.format(self.model_name, link_name)
 
-            if hasattr(self, '{}_kwargs'.format(link)):
-                link_kwargs = getattr(self, '{}_kwargs_regexp'.format(link))
-                url_check += '{}/'.format(link_kwargs)
+        if hasattr(self, '{}_kwargs'.format(link)):
+            link_kwargs = getattr(self, '{}_kwargs_regexp'.format(link))
+            url_check += '{}/'.format(link_kwargs)
 
-            # Add start and end of line to regex pattern
-            url_check = '^%s$' % url_check
+        # Add start and end of line to regex pattern
+        return '^%s$' % url_check
 
-            action_cls = getattr(self, '{}_class'.format(link))
-            urls.append(url(url_check, action_cls, name=self.link_name(link)))
+    def build_view(self, link):
+        """
+        Builds the view callable of a link from its view class and view kwargs.
+        A *_class property that is overridden in a subclass is used as it is.
+
+        :param link: link
+        :return: view callable
+        """
+        class_attr = '{}_class'.format(link)
+        if getattr(type(self), class_attr, None) is not getattr(DynamicCRUDView, class_attr, None):
+            return getattr(self, class_attr)
 
-        return urls
+        view_class = getattr(self, '{}_view_class'.format(link))
+        return view_class.as_view(**getattr(self, 'get_{}_view_kwargs'.format(link))())
+
+    def build_view_configs(self):
+        """
+        Builds the view of every link. as_view validates the view kwargs, so a misconfiguration
+        raises when the views are built (on the first request or url configuration import, or
+        in the system checks) instead of when a url is requested.
+
+        :return: OrderedDict with link -> ViewConfig
+        """
+        return OrderedDict(
+            (link, ViewConfig(link, self.link_name(link), self.get_url_regex(link), self.build_view(link)))
+            for link in self.get_links()
+        )
+
+    def get_view_configs(self):
+        """
+        Returns the view configs, built on the first call and cached on the class (a subclass
+        builds its own)
+
+        :return: OrderedDict with link -> ViewConfig
+        """
+        cls = type(self)
+        if cls.model is None:
+            raise ImproperlyConfigured('{} has no model'.format(cls.__name__))
+        if '_view_configs' not in cls.__dict__:
+            cls._view_configs = self.build_view_configs()
+        return cls._view_configs
+
+    def get_view(self, link):
+        """
+        Returns the view callable of a link, built once per class
+
+        :param link: link
+        :return: view callable
+        """
+        view_configs = self.get_view_configs()
+        if link not in view_configs:
+            return self.build_view(link)
+        return view_configs[link].view
+
+    def urls(self):
+        cls = type(self)
+        if '_url_patterns' not in cls.__dict__:
+            cls._url_patterns = [url(config.regex, config.view, name=config.name)
+                                 for config in self.get_view_configs().values()]
+        return list(cls._url_patterns)
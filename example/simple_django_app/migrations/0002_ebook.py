@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simple_django_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Ebook',
+            fields=[
+                ('book_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE,
+                                                  parent_link=True, primary_key=True, serialize=False,
+                                                  to='simple_django_app.Book')),
+                ('file_format', models.CharField(default='epub', max_length=20)),
+            ],
+            bases=('simple_django_app.book',),
+        ),
+    ]
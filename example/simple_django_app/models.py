@@ -24,3 +24,7 @@ class Book(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class Ebook(Book):
+    file_format = models.CharField(max_length=20, default='epub')
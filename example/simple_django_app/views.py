@@ -8,8 +8,12 @@ class BookCRUD(DynamicCRUDView):
     """
     model = Book
     field_names = ['title', 'description', 'author', 'genre', 'pages']
-    links = ['list', 'create', 'read', 'update']
+    links = ['list', 'create', 'read', 'update', 'export', 'import']
     paginate_by = 5
+    filter_fields = (('author__pk', 'author__name'),)
+    filter_lazy = True
+    bulk_actions = ['delete', 'update']
+    bulk_update_fields = ['pages', 'genre']
 
 
 class GenreCRUD(DynamicCRUDView):
@@ -22,6 +22,11 @@ try:
         ],
         SITE_ID=1,
         MIDDLEWARE_CLASSES=(),
+        DYNAMIC_VIEWS_CACHED_MODELS=[
+            "simple_django_app.Author",
+            "simple_django_app.Genre",
+            "simple_django_app.Book",
+        ],
     )
 
     try:
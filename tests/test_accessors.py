@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` accessors module.
+"""
+from django.test import TestCase
+
+from django_dynamic_views.accessors import get_accessor
+from example.simple_django_app.models import Author, Genre, Book
+
+
+class TestAccessors(TestCase):
+
+    def setUp(self):
+        self.author = Author.objects.create(name='Joe')
+        self.genre = Genre.objects.create(name='SciFy')
+        self.book = Book.objects.create(author=self.author, genre=self.genre, title='Book 1', pages=100)
+
+    def test_model_paths(self):
+        self.assertEqual(get_accessor(Book, 'title')(self.book), 'Book 1')
+        self.assertEqual(get_accessor(Book, 'pk')(self.book), self.book.pk)
+        self.assertEqual(get_accessor(Book, 'author')(self.book), self.author)
+        self.assertEqual(get_accessor(Book, 'author__name')(self.book), 'Joe')
+        self.assertEqual(get_accessor(Book, 'author.name')(self.book), 'Joe')
+        self.assertEqual(get_accessor(Book, 'get_deferred_fields')(self.book), set())
+        self.assertEqual(get_accessor(Book, 'title__upper')(self.book), 'BOOK 1')
+        self.assertEqual(list(get_accessor(Author, 'book_set__all')(self.author)), [self.book])
+
+    def test_generic_paths(self):
+        row = {'title': 'Book 1', 'tags': ['a', 'b']}
+        self.assertEqual(get_accessor(dict, 'title')(row), 'Book 1')
+        self.assertEqual(get_accessor(dict, 'tags__1')(row), 'b')
+
+    def test_invalid_path(self):
+        self.assertEqual(get_accessor(Book, 'unknown__name')(self.book), '')
+
+    def test_accessor_is_cached(self):
+        self.assertIs(get_accessor(Book, 'author__name'), get_accessor(Book, 'author__name'))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` cache module.
+"""
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db.models import signals
+from django.test import TestCase, RequestFactory
+
+from django_dynamic_views import cache as cache_module
+from django_dynamic_views.cache import (
+    bump_model_version, get_model_versions, get_version_key, watch_models, watch_setting_models,
+)
+from example.simple_django_app.models import Author, Genre, Book
+from example.simple_django_app.views import BookFilterList
+
+
+class CachedBookList(BookFilterList):
+    fragment_cache = True
+    field_names = ['title', 'author__name', 'pages']
+
+
+class TestFragmentCache(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.author = Author.objects.create(name='Joe')
+        self.genre = Genre.objects.create(name='SciFy')
+        self.book = Book.objects.create(author=self.author, genre=self.genre, title='Book 1', pages=100)
+
+    def render(self, url='/bookfilter/'):
+        response = CachedBookList.as_view()(self.factory.get(url))
+        return response.render().content.decode('utf-8')
+
+    def test_model_versions(self):
+        version, = get_model_versions([Book])
+        self.assertEqual(get_model_versions([Book]), [version])
+
+        bump_model_version(Book)
+        self.assertNotEqual(get_model_versions([Book]), [version])
+
+        version, = get_model_versions([Author])
+        self.author.save()
+        self.assertNotEqual(get_model_versions([Author]), [version])
+
+    def test_watched_models(self):
+        # Models without cached lists keep the fast delete
+        self.assertFalse(signals.post_delete.has_listeners(Permission))
+
+        watch_models([Group])
+        self.assertTrue(signals.post_save.has_listeners(Group))
+        self.assertTrue(signals.m2m_changed.has_listeners(Group.permissions.through))
+
+        version, = get_model_versions([Group])
+        Group.objects.create(name='Editors').permissions.add(Permission.objects.first())
+        self.assertNotEqual(get_model_versions([Group]), [version])
+
+    def test_invalidation_without_rendering(self):
+        # A process that never rendered a list (e.g. a task worker) only has the receivers of the setting
+        for model in list(cache_module._watched_models):
+            signals.post_save.disconnect(sender=model, dispatch_uid=get_version_key(model))
+            signals.post_delete.disconnect(sender=model, dispatch_uid=get_version_key(model))
+        cache_module._watched_models.clear()
+        self.assertFalse(signals.post_save.has_listeners(Author))
+
+        watch_setting_models()
+        version, = get_model_versions([Author])
+        self.author.save()
+        self.assertNotEqual(get_model_versions([Author]), [version])
+
+    def test_cached_fragments(self):
+        content = self.render()
+        self.assertIn('Book 1', content)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.render(), content)
+
+        # Another state is cached separately
+        self.assertNotIn('Book 1', self.render('/bookfilter/?search_phrase=unknown'))
+
+    def test_invalidation(self):
+        self.render()
+
+        self.author.name = 'Ann'
+        self.author.save()
+        self.assertIn('Ann', self.render())
+
+        Book.objects.create(author=self.author, genre=self.genre, title='Book 2', pages=100)
+        self.assertIn('Book 2', self.render())
+
+
+class TestFilterCache(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.author = Author.objects.create(name='Joe')
+        self.genre = Genre.objects.create(name='SciFy')
+        Book.objects.create(author=self.author, genre=self.genre, title='Book 1', pages=100)
+
+    def get_filter_values(self, url='/bookfilter/', **initkwargs):
+        view = BookFilterList(**initkwargs)
+        view.request = RequestFactory().get(url)
+        view.kwargs = {}
+        view.list_state = view.get_list_state()
+        return view.get_filter_values()
+
+    def test_cached_filter_values(self):
+        filter_values = self.get_filter_values(filter_cache=True)
+        self.assertEqual(filter_values[0][2], [(self.author.pk, 'Joe')])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_filter_values(filter_cache=True), filter_values)
+
+        with self.assertNumQueries(1):
+            self.get_filter_values(filter_cache=['author__pk'])
+
+    def test_filter_cache_key(self):
+        class UserBookList(BookFilterList):
+            filter_cache = True
+
+            def get_filter_cache_key(self, base, filter_key, filter_name):
+                key = super(UserBookList, self).get_filter_cache_key(base, filter_key, filter_name)
+                return '{}.{}'.format(key, self.request.GET.get('user'))
+
+        def get_filter_values(url):
+            view = UserBookList()
+            view.request = RequestFactory().get(url)
+            view.kwargs = {}
+            view.list_state = view.get_list_state()
+            return view.get_filter_values()
+
+        get_filter_values('/bookfilter/?user=1')
+        with self.assertNumQueries(0):
+            get_filter_values('/bookfilter/?user=1')
+        with self.assertNumQueries(2):
+            get_filter_values('/bookfilter/?user=2')
+
+    def test_filter_values_invalidation(self):
+        self.get_filter_values(filter_cache=True)
+
+        self.author.name = 'Ann'
+        self.author.save()
+        self.assertEqual(self.get_filter_values(filter_cache=True)[0][2], [(self.author.pk, 'Ann')])
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` checks module.
+"""
+from django.apps import apps
+from django.test import TestCase, override_settings
+
+from django_dynamic_views.checks import check_dynamic_views, get_cache_errors, get_path_errors
+from django_dynamic_views.query import QueryPlan
+from django_dynamic_views.views import DynamicListView
+from example.simple_django_app.models import Book
+from example.simple_django_app.views import BookFilterList
+
+
+class TestChecks(TestCase):
+
+    def test_valid_paths(self):
+        view = BookFilterList(field_names=['title', 'author__name', 'get_deferred_fields', 'num'],
+                              annotate_fields={'num': None}, order_fields=['num', 'author__name'])
+        self.assertEqual(get_path_errors('books', view), [])
+
+    def test_invalid_paths(self):
+        view = DynamicListView(model=Book, field_names=['title', 'author__nam', 'unknown'],
+                               search_fields=['^author__name', 'get_deferred_fields'],
+                               filter_fields=[('author__pk', 'author__fullname')], order_fields=['pages'])
+        errors = get_path_errors('books', view)
+
+        self.assertEqual([error.id for error in errors], ['django_dynamic_views.E001'] * 2 +
+                         ['django_dynamic_views.E002'] * 2)
+        self.assertIn("'author__nam' in field_names", errors[0].msg)
+        self.assertIn("'get_deferred_fields' in search_fields", errors[2].msg)
+        self.assertIn("'author__fullname' in filter_fields", errors[3].msg)
+
+    def test_check_compiles_views(self):
+        QueryPlan._cache.clear()
+        errors = check_dynamic_views(app_configs=[apps.get_app_config('simple_django_app')])
+
+        self.assertEqual(errors, [])
+        self.assertTrue(any(key[0] is Book and key[1] == tuple(BookFilterList.field_names)
+                            for key in QueryPlan._cache))
+
+    @override_settings(DYNAMIC_VIEWS_CACHED_MODELS=['simple_django_app.Book'])
+    def test_cached_models(self):
+        self.assertEqual(get_cache_errors('books', BookFilterList()), [])
+
+        errors = get_cache_errors('books', BookFilterList(fragment_cache=True))
+        self.assertEqual([error.id for error in errors], ['django_dynamic_views.E003'] * 2)
+        self.assertIn('simple_django_app.Author is not in', errors[0].msg)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` counts module.
+"""
+from django.core.cache import cache
+from django.test import TestCase, RequestFactory
+
+from django_dynamic_views.counts import CachedCount, EstimatedCount, ExactCount
+from example.simple_django_app.models import Author, Genre, Book
+from example.simple_django_app.views import BookFilterList
+
+
+class TestCounts(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        author = Author.objects.create(name='Joe')
+        genre = Genre.objects.create(name='SciFy')
+        for i in range(3):
+            Book.objects.create(author=author, genre=genre, title='Book {}'.format(i), pages=100)
+
+    def get_view(self, url='/bookfilter/', **initkwargs):
+        view = BookFilterList(**initkwargs)
+        view.request = RequestFactory().get(url)
+        view.args = ()
+        view.kwargs = {}
+        view.list_state = view.get_list_state()
+        return view
+
+    def test_exact_count(self):
+        view = self.get_view()
+        self.assertEqual(ExactCount().count(view.get_queryset(), view), (3, False))
+
+    def test_cached_count(self):
+        view = self.get_view('/bookfilter/?search_phrase=Book&order_by=title')
+        strategy = CachedCount()
+        self.assertEqual(strategy.count(view.get_queryset(), view), (3, False))
+
+        view = self.get_view('/bookfilter/?search_phrase=Book&page=2')
+        with self.assertNumQueries(0):
+            self.assertEqual(strategy.count(view.get_queryset(), view), (3, False))
+
+        view = self.get_view('/bookfilter/?search_phrase=Book 1')
+        self.assertEqual(strategy.count(view.get_queryset(), view), (1, False))
+
+        Book.objects.create(author=Author.objects.get(), genre=Genre.objects.get(), title='Book 3', pages=100)
+        view = self.get_view('/bookfilter/?search_phrase=Book')
+        self.assertEqual(strategy.count(view.get_queryset(), view), (4, False))
+        self.assertTrue(view.__class__(count_strategy=strategy).uses_model_versions())
+
+    def test_estimated_count_falls_back_to_exact(self):
+        view = self.get_view()
+        strategy = EstimatedCount(threshold=1)
+        self.assertIsNone(strategy.estimate(view.get_queryset()))
+        self.assertEqual(strategy.count(view.get_queryset(), view), (3, False))
+
+    def test_estimated_count_near_the_end(self):
+        strategy = EstimatedCount(threshold=1)
+        strategy.estimate = lambda queryset: 2
+
+        view = self.get_view('/bookfilter/?paginate_by=1')
+        self.assertEqual(strategy.count(view.get_queryset(), view), (2, True))
+        # The estimated last page, the 'last' page and the pages after it are counted exactly
+        for page in ('2', '3', 'last'):
+            view = self.get_view('/bookfilter/?paginate_by=1&page={}'.format(page))
+            self.assertEqual(strategy.count(view.get_queryset(), view), (3, False))
+
+    def test_estimated_count_render(self):
+        class EstimatedBookList(BookFilterList):
+            paginate_by = 2
+
+            def get_count_strategy(self):
+                strategy = EstimatedCount(threshold=100)
+                strategy.estimate = lambda queryset: 1000
+                return strategy
+
+        response = EstimatedBookList.as_view()(RequestFactory().get('/bookfilter/'))
+        response.render()
+        self.assertContains(response, 'total items: about 1000')
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` imports module.
+"""
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+from django.test import TestCase
+
+from django_dynamic_views.imports import read_csv_rows
+from django_dynamic_views.views import DynamicImportView
+from example.simple_django_app.models import Author, Genre, Book
+
+
+class UniqueTitleImportView(DynamicImportView):
+    """
+    Fails like a unique constraint on the title would
+    """
+
+    def insert_batch(self, objects):
+        titles = [obj.title for obj in objects]
+        if len(set(titles)) < len(titles) or Book.objects.filter(title__in=titles).exists():
+            raise IntegrityError('UNIQUE constraint failed: title')
+        super(UniqueTitleImportView, self).insert_batch(objects)
+
+
+class TestImports(TestCase):
+
+    def setUp(self):
+        self.author = Author.objects.create(name='Joe')
+        self.genre = Genre.objects.create(name='SciFy')
+
+    def test_read_csv_rows(self):
+        lines = [b'\xef\xbb\xbftitle,Number of pages,unknown\n', b'Book 1,100,x\n', b'\n', b'Book 2,200,y\n']
+        rows = list(read_csv_rows(lines, ['title', 'pages'], {'pages': 'Number of pages'}))
+        self.assertEqual(rows, [(2, {'title': 'Book 1', 'pages': '100'}), (4, {'title': 'Book 2', 'pages': '200'})])
+
+    def test_import_csv(self):
+        content = 'title,description,author,genre,pages\n'
+        content += ''.join('Book {0},Text,{1},{2},{0}\n'.format(index, self.author.pk, self.genre.pk)
+                           for index in range(5))
+        content += 'Bad,Text,{},{},many\n'.format(self.author.pk, self.genre.pk)
+        content += 'Unknown author,Text,0,{},1\n'.format(self.genre.pk)
+        upload = SimpleUploadedFile('books.csv', content.encode('utf-8'))
+
+        response = self.client.post('/book/import/', {'file': upload, 'format': 'csv'})
+        self.assertEqual(response.status_code, 200)
+
+        report = response.context['import_report']
+        self.assertEqual((report['rows'], report['imported'], report['error_count']), (7, 5, 2))
+        self.assertEqual([line_number for line_number, message in report['errors']], [7, 8])
+        self.assertEqual(Book.objects.filter(author=self.author, genre=self.genre).count(), 5)
+
+    def test_import_csv_non_ascii(self):
+        content = u'title,description,author,genre\nCafé,Crème,{},{}\n'.format(self.author.pk, self.genre.pk)
+        rows = list(read_csv_rows(iter(content.encode('utf-8').splitlines(True)), ['title', 'description']))
+        self.assertEqual(rows, [(2, {'title': u'Café', 'description': u'Crème'})])
+
+    def test_import_batches(self):
+        view = DynamicImportView(model=Book, field_names=['pk', 'title', 'author', 'genre', 'pages'],
+                                 import_batch_size=2)
+        data = {'title': 'Book', 'description': 'Text', 'author': self.author.pk, 'genre': self.genre.pk, 'pages': 1}
+        rows = [(index, dict(data)) for index in range(5)]
+
+        # One lookup per foreign key, one transaction (savepoint) and insert per batch
+        with self.assertNumQueries(2 + 3 * 3):
+            report = view.import_rows(iter(rows))
+
+        self.assertEqual(report['imported'], 5)
+        self.assertEqual(Book.objects.count(), 5)
+
+    def test_import_batch_errors_per_row(self):
+        view = UniqueTitleImportView(model=Book, field_names=['title', 'description', 'author', 'genre'],
+                                     import_batch_size=3)
+        data = {'description': 'Text', 'author': self.author.pk, 'genre': self.genre.pk}
+        titles = ['Book 1', 'Book 2', 'Book 1', 'Book 3', 'Book 4']
+        report = view.import_rows((line_number, dict(data, title=title)) for line_number, title in enumerate(titles, 2))
+
+        self.assertEqual((report['imported'], report['error_count']), (4, 1))
+        self.assertEqual(report['errors'], [(4, 'UNIQUE constraint failed: title')])
+        self.assertEqual(sorted(Book.objects.values_list('title', flat=True)), ['Book 1', 'Book 2', 'Book 3', 'Book 4'])
+
+    def test_import_jsonl(self):
+        content = '{{"title": "Book", "description": "Text", "author": {0}, "genre": {1}, "pages": 10}}\n'.format(
+            self.author.pk, self.genre.pk)
+        content += 'not json\n'
+        upload = SimpleUploadedFile('books.jsonl', content.encode('utf-8'))
+
+        response = self.client.post('/book/import/', {'file': upload, 'format': 'jsonl'})
+        report = response.context['import_report']
+        self.assertEqual((report['imported'], report['errors']), (1, [(2, 'Invalid line')]))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` links module.
+"""
+import mock
+
+from django.conf.urls import include, url
+from django.core.urlresolvers import NoReverseMatch, reverse
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+
+from django_dynamic_views.links import LinkPattern
+
+
+def item_view(request, pk):
+    return HttpResponse(pk)
+
+
+item_patterns = [
+    url(r'^item/(?P<pk>[-\w]+)/$', item_view, name='item'),
+]
+
+urlpatterns = [
+    url(r'^digits/(\d+)/$', item_view, name='digits'),
+    url(r'^first/', include((item_patterns, 'items'), namespace='first')),
+    url(r'^second/', include((item_patterns, 'items'), namespace='second')),
+]
+
+
+@override_settings(ROOT_URLCONF='tests.test_links')
+class TestLinkPattern(TestCase):
+
+    def test_pk_is_substituted(self):
+        with mock.patch('django_dynamic_views.links.reverse', wraps=reverse) as patched_reverse:
+            pattern = LinkPattern('digits')
+            self.assertEqual([pattern(1), pattern('23')], ['/digits/1/', '/digits/23/'])
+        # The text placeholder is rejected, the numeric one is used
+        self.assertEqual(patched_reverse.call_count, 2)
+
+    def test_pk_not_matching_the_pattern_is_reversed(self):
+        pattern = LinkPattern('digits')
+        with self.assertRaises(NoReverseMatch):
+            pattern('a1')
+        with self.assertRaises(NoReverseMatch):
+            pattern('1/2')
+
+        pattern = LinkPattern('first:item')
+        self.assertEqual(pattern('a-1'), '/first/item/a-1/')
+        with self.assertRaises(NoReverseMatch):
+            pattern('a b')
+
+    def test_current_app(self):
+        self.assertEqual(LinkPattern('items:item')('1'), '/second/item/1/')
+        self.assertEqual(LinkPattern('items:item', current_app='first')('1'), '/first/item/1/')
+        self.assertEqual(LinkPattern('items:item', current_app='second')('1'), '/second/item/1/')
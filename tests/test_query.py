@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` query module.
+"""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_dynamic_views.query import FieldPath, QueryPlan
+from example.simple_django_app.models import Author, Genre, Book
+
+
+class TestQueryPlan(TestCase):
+
+    def setUp(self):
+        self.author = Author.objects.create(name='Joe')
+        self.genre = Genre.objects.create(name='SciFy')
+        for i in range(3):
+            Book.objects.create(author=self.author, genre=self.genre, title='Book {}'.format(i), pages=100)
+
+    def test_field_path_kinds(self):
+        self.assertEqual(FieldPath(Book, 'title').kind, FieldPath.COLUMN)
+        self.assertEqual(FieldPath(Book, 'author__name').kind, FieldPath.COLUMN)
+        self.assertEqual(FieldPath(Book, 'author').kind, FieldPath.RELATION)
+        self.assertEqual(FieldPath(Book, '__str__').kind, FieldPath.ATTRIBUTE)
+        self.assertTrue(FieldPath(Author, 'book_set').multi_valued)
+        self.assertTrue(FieldPath(Author, 'book__title').multi_valued)
+
+    def test_select_related(self):
+        plan = QueryPlan(Book, ['title', 'author__name', 'genre'])
+        self.assertEqual(plan.select_related, ['author', 'genre'])
+        self.assertEqual(plan.prefetch_related, [])
+        self.assertEqual(plan.only, ['pk', 'title', 'author', 'author__name', 'genre', 'genre__id', 'genre__name'])
+
+        with CaptureQueriesContext(connection) as context:
+            for book in plan.apply(Book.objects.all(), only=True):
+                str(book.author.name)
+                str(book.genre)
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_prefetch_related(self):
+        plan = QueryPlan(Author, ['name', 'book_set'])
+        self.assertEqual(plan.select_related, [])
+        self.assertEqual(plan.prefetch_related, ['book_set'])
+
+        with CaptureQueriesContext(connection) as context:
+            for author in plan.apply(Author.objects.all(), only=True):
+                list(author.book_set.all())
+        self.assertEqual(len(context.captured_queries), 2)
+
+    def test_attribute_disables_only(self):
+        plan = QueryPlan(Book, ['title', '__str__'])
+        self.assertIsNone(plan.only)
+
+    def test_plan_is_cached(self):
+        self.assertIs(QueryPlan.for_model(Book, ['title']), QueryPlan.for_model(Book, ['title']))
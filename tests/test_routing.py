@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` routing module.
+"""
+import time
+
+from django.test import TestCase, RequestFactory, override_settings
+
+from django_dynamic_views.routing import PRIMARY_COOKIE
+from django_dynamic_views.views import AdminDynamicListView, DynamicReadView
+from example.simple_django_app.models import Author, Genre, Book
+from example.simple_django_app.views import BookFilterList
+
+
+class TestRouting(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.author = Author.objects.create(name='Joe')
+        self.genre = Genre.objects.create(name='SciFy')
+        self.book = Book.objects.create(author=self.author, genre=self.genre, title='Book 1', pages=100)
+
+    def get_view(self, view_class=BookFilterList, request=None, **initkwargs):
+        view = view_class(**initkwargs)
+        view.request = request or self.factory.get('/bookfilter/?search_phrase=Book')
+        view.args = ()
+        view.kwargs = {}
+        if hasattr(view, 'get_list_state'):
+            view.list_state = view.get_list_state()
+        return view
+
+    def test_default_routing(self):
+        view = self.get_view()
+        self.assertIsNone(view.get_read_using())
+        self.assertEqual(view.get_queryset().db, 'default')
+
+    def test_round_robin(self):
+        aliases = [self.get_view(read_using=['replica1', 'replica2']).get_read_using() for index in range(4)]
+        self.assertEqual(sorted(aliases), ['replica1', 'replica1', 'replica2', 'replica2'])
+        self.assertNotEqual(aliases[0], aliases[1])
+
+        view = self.get_view(read_using='replica1')
+        self.assertEqual(view.get_queryset().db, 'replica1')
+        self.assertEqual(view.get_filter_queryset().db, 'replica1')
+
+        view = self.get_view(DynamicReadView, model=Book, read_using='replica1')
+        self.assertEqual(view.get_queryset().db, 'replica1')
+
+    @override_settings(DYNAMIC_VIEWS_READ_DATABASES=['replica1'])
+    def test_setting_and_pin(self):
+        self.assertEqual(self.get_view().get_read_using(), 'replica1')
+
+        request = self.factory.get('/bookfilter/')
+        request.COOKIES[PRIMARY_COOKIE] = str(time.time() + 5)
+        self.assertEqual(self.get_view(request=request).get_read_using(), 'default')
+
+        request.COOKIES[PRIMARY_COOKIE] = str(time.time() - 1)
+        self.assertEqual(self.get_view(request=request).get_read_using(), 'replica1')
+
+    def test_post_pins_primary(self):
+        response = self.client.post('/book/update/{}/'.format(self.book.pk), {
+            'title': 'Book 2', 'description': 'Text', 'author': self.author.pk, 'genre': self.genre.pk, 'pages': 10,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertGreater(float(response.cookies[PRIMARY_COOKIE].value), time.time())
+
+        response = self.client.post('/book/list/', {'bulk_action': 'drop'})
+        self.assertNotIn(PRIMARY_COOKIE, response.cookies)
+
+    def test_bulk_actions_use_primary(self):
+        view = self.get_view(AdminDynamicListView, request=self.factory.post('/book/list/', {'select_across': 1}),
+                             model=Book, read_using='replica1')
+        self.assertEqual(view.get_filter_queryset().db, 'replica1')
+        self.assertEqual(view.get_bulk_queryset().db, 'default')
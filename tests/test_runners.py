@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` runners module.
+"""
+import threading
+from collections import OrderedDict
+
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase
+
+from django_dynamic_views.runners import SequentialRunner, ThreadPoolRunner
+from example.simple_django_app.models import Author, Genre, Book
+from example.simple_django_app.views import BookFilterList
+
+
+def current_thread():
+    return threading.current_thread().ident
+
+
+class TestRunners(SimpleTestCase):
+
+    def test_sequential_runner(self):
+        results = SequentialRunner().run(OrderedDict([('a', lambda: 1), ('b', lambda: 2)]))
+        self.assertEqual(list(results.items()), [('a', 1), ('b', 2)])
+
+    def test_thread_pool_runner(self):
+        runner = ThreadPoolRunner(max_workers=2)
+        results = runner.run(OrderedDict((name, current_thread) for name in 'abc'))
+
+        self.assertEqual(list(results), ['a', 'b', 'c'])
+        self.assertEqual(results['a'], current_thread())
+        self.assertNotEqual(results['b'], current_thread())
+        self.assertNotEqual(results['c'], current_thread())
+
+    def test_thread_pool_runner_saturated(self):
+        runner = ThreadPoolRunner(max_workers=1)
+        runner.slots.acquire()
+
+        results = runner.run(OrderedDict((name, current_thread) for name in 'ab'))
+        self.assertEqual(set(results.values()), {current_thread()})
+
+    def test_thread_pool_runner_error(self):
+        def fail():
+            raise ValueError()
+
+        runner = ThreadPoolRunner(max_workers=1)
+        with self.assertRaises(ValueError):
+            runner.run(OrderedDict([('a', lambda: 1), ('b', fail)]))
+
+        # The slot is released
+        self.assertTrue(runner.slots.acquire(False))
+
+
+class TestThreadPoolRunnerTransaction(TestCase):
+
+    def test_sequential_in_transaction(self):
+        results = ThreadPoolRunner().run(OrderedDict((name, current_thread) for name in 'ab'))
+        self.assertEqual(set(results.values()), {current_thread()})
+
+
+class TestThreadPoolRunnerList(TransactionTestCase):
+
+    def test_list(self):
+        author = Author.objects.create(name='Joe')
+        genre = Genre.objects.create(name='SciFy')
+        for index in range(4):
+            Book.objects.create(author=author, genre=genre, title='Book {}'.format(index), pages=100)
+
+        class ThreadedBookList(BookFilterList):
+            query_runner = ThreadPoolRunner(max_workers=2)
+            paginate_by = 3
+
+        response = ThreadedBookList.as_view()(RequestFactory().get('/bookfilter/'))
+        self.assertEqual(response.context_data['paginator'].count, 4)
+        self.assertEqual(len(response.context_data['rows']), 3)
+        self.assertEqual(response.context_data['filter_values'][0][2], [(author.pk, 'Joe')])
+        self.assertEqual(response.context_data['filter_values'][1][2], [(genre.pk, 'SciFy')])
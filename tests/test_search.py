@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` search module.
+"""
+from django.db.models import Max
+from django.db.models.functions import Length
+from django.test import TestCase, RequestFactory
+
+from django_dynamic_views.checks import get_path_errors
+from django_dynamic_views.search import IContainsSearch, SQLiteFTS5Search, split_search_field, split_search_phrase
+from django_dynamic_views.views import DynamicListView
+from example.simple_django_app.models import Author, Genre, Book
+from example.simple_django_app.views import BookFilterList
+
+
+class LengthRankSearch(IContainsSearch):
+    """
+    Ranks on the length of the first search path, to test the ranking without PostgreSQL
+    """
+
+    def add_rank(self, queryset, search_fields, search_phrase, aggregate=False):
+        rank = Length(self.search_paths(search_fields)[0])
+        if aggregate:
+            rank = Max(rank)
+        return queryset.annotate(search_rank=rank).order_by('-search_rank')
+
+
+class TestSearch(TestCase):
+
+    def setUp(self):
+        author = Author.objects.create(name='Joe')
+        genre = Genre.objects.create(name='SciFy')
+        self.book_a = Book.objects.create(author=author, genre=genre, title='Space opera', description='Ships')
+        self.book_b = Book.objects.create(author=author, genre=genre, title='Deep space', description='Stations')
+        self.book_c = Book.objects.create(author=author, genre=genre, title='Cooking', description='Recipes')
+
+    def test_icontains_search(self):
+        queryset = IContainsSearch().search(Book.objects.all(), ['title', 'description'], 'space')
+        self.assertEqual(set(queryset), {self.book_a, self.book_b})
+
+    def test_sqlite_fts5_search(self):
+        backend = SQLiteFTS5Search('simple_django_app_book_fts')
+        backend.rebuild(Book.objects.all(), ['title', 'description', 'author__name'])
+
+        self.assertEqual(set(backend.search(Book.objects.all(), [], 'space')), {self.book_a, self.book_b})
+        self.assertEqual(list(backend.search(Book.objects.all(), [], 'deep "space')), [self.book_b])
+        self.assertEqual(backend.search_paths(['author__name']), [])
+
+    def test_view_search_backend(self):
+        backend = SQLiteFTS5Search('simple_django_app_book_fts')
+        backend.rebuild(Book.objects.all(), ['title'])
+
+        view = BookFilterList(search_backend=backend)
+        view.request = RequestFactory().get('/bookfilter/?search_phrase=cooking')
+        view.kwargs = {}
+        view.list_state = view.get_list_state()
+        self.assertEqual(list(view.get_queryset()), [self.book_c])
+
+    def test_search_terms(self):
+        backend = IContainsSearch()
+        self.assertEqual(split_search_phrase('deep "space opera" \'x\''), ['deep', 'space opera', 'x'])
+
+        queryset = backend.search(Book.objects.all(), ['title', 'description'], 'space stations')
+        self.assertEqual(list(queryset), [self.book_b])
+
+        queryset = backend.search(Book.objects.all(), ['title', 'description'], '"space opera"')
+        self.assertEqual(list(queryset), [self.book_a])
+
+    def test_search_field_lookups(self):
+        backend = IContainsSearch()
+        self.assertEqual(split_search_field('^title'), ('title', 'istartswith'))
+        self.assertEqual(split_search_field('=author__name'), ('author__name', 'iexact'))
+        self.assertEqual(backend.search_paths(['=description', 'title']), ['description', 'title'])
+
+        queryset = backend.search(Book.objects.all(), ['^title'], 'space')
+        self.assertEqual(list(queryset), [self.book_a])
+
+        queryset = backend.search(Book.objects.all(), ['=description'], 'recipes')
+        self.assertEqual(list(queryset), [self.book_c])
+
+    def test_rank_after_distinct(self):
+        author = Author.objects.create(name='Ann')
+        Book.objects.create(author=author, genre=self.book_a.genre, title='Space', description='')
+        Book.objects.create(author=author, genre=self.book_a.genre, title='A very long space title', description='')
+
+        view = DynamicListView(model=Author, field_names=['name'], search_fields=['book__title'],
+                               search_backend=LengthRankSearch())
+        view.request = RequestFactory().get('/?search_phrase=space')
+        view.kwargs = {}
+        view.list_state = view.get_list_state()
+
+        queryset = view.get_queryset()
+        self.assertEqual([(item.name, item.search_rank) for item in queryset], [('Ann', 23), ('Joe', 11)])
+        self.assertEqual(queryset.count(), 2)
+
+    def test_full_text_prefix_is_not_a_lookup(self):
+        self.assertEqual(split_search_field('@description'), ('@description', 'icontains'))
+
+        errors = get_path_errors('books', BookFilterList(search_fields=['title', '@description']))
+        self.assertEqual([error.id for error in errors], ['django_dynamic_views.E002'])
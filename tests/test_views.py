@@ -0,0 +1,499 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-dynamic-views
+------------
+
+Tests for `django-dynamic-views` views module.
+"""
+import json
+
+import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.urlresolvers import reverse
+from django.http import Http404
+from django.test import TestCase, RequestFactory
+
+from django_dynamic_views.checks import check_dynamic_views
+from django_dynamic_views.deletion import DeleteCounter
+from django_dynamic_views.registry import registry
+from django_dynamic_views.routing import PRIMARY_COOKIE
+from django_dynamic_views.runners import SequentialRunner
+from django_dynamic_views.views import AdminDynamicListView, DynamicCRUDView, DynamicDeleteView, DynamicListView
+from example.simple_django_app.models import Author, Genre, Book, Ebook
+from example.simple_django_app.views import AuthorCRUD, BookCRUD, BookFilterList
+
+
+class TestDynamicListView(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.author_a = Author.objects.create(name='Joe')
+        self.author_b = Author.objects.create(name='Ann')
+        self.genre_a = Genre.objects.create(name='SciFy')
+        self.genre_b = Genre.objects.create(name='Drama')
+        Book.objects.create(author=self.author_a, genre=self.genre_a, title='Book 1', pages=100)
+        Book.objects.create(author=self.author_a, genre=self.genre_a, title='Book 2', pages=200)
+        Book.objects.create(author=self.author_b, genre=self.genre_a, title='Book 3', pages=300)
+        Book.objects.create(author=self.author_b, genre=self.genre_b, title='Book 4', pages=100)
+
+    def get_view(self, url='/bookfilter/', **initkwargs):
+        view = BookFilterList(**initkwargs)
+        view.request = self.factory.get(url)
+        view.args = ()
+        view.kwargs = {}
+        view.list_state = view.get_list_state()
+        return view
+
+    def test_filter_values_are_distinct(self):
+        view = self.get_view()
+        with self.assertNumQueries(2):
+            filter_values = view.get_filter_values()
+
+        self.assertEqual(filter_values[0][0], 'author__pk')
+        self.assertEqual(filter_values[0][2], [(self.author_b.pk, 'Ann'), (self.author_a.pk, 'Joe')])
+        self.assertEqual(filter_values[1][2], [(self.genre_b.pk, 'Drama'), (self.genre_a.pk, 'SciFy')])
+
+    def test_filter_values_counts_and_limit(self):
+        view = self.get_view(filter_counts=True, filter_limits={'genre__pk': 1})
+        filter_values = view.get_filter_values()
+
+        self.assertEqual(filter_values[0][2], [(self.author_b.pk, 'Ann', 2), (self.author_a.pk, 'Joe', 2)])
+        self.assertEqual(filter_values[1][2], [(self.genre_b.pk, 'Drama', 1)])
+
+    def test_filter_values_selected(self):
+        view = self.get_view('/bookfilter/?filter-author__pk={}'.format(self.author_a.pk))
+        filter_values = view.get_filter_values()
+
+        self.assertEqual(filter_values[0][2], [(self.author_a.pk, 'Joe')])
+        self.assertEqual(filter_values[0][3], 'Joe')
+
+    def test_filter_list(self):
+        response = self.client.get('/bookfilter/?filter-genre__pk={}'.format(self.genre_b.pk))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['object_list']), list(Book.objects.filter(genre=self.genre_b)))
+
+    def test_list_state(self):
+        view = self.get_view('/bookfilter/?order_by=title&sort=DESC&search_phrase=Book'
+                             '&filter-genre__pk=1&filter-author__pk=---')
+        self.assertEqual(view.list_state.search_phrase, 'Book')
+        self.assertEqual(view.list_state.filter_kwargs, {'genre__pk': '1'})
+        self.assertEqual(view.list_state.order_by, '')
+
+        view = self.get_view('/bookfilter/?order_by=title&sort=DESC', order_fields=['title'])
+        self.assertEqual(view.order_by, '-title')
+        self.assertEqual(view.list_state.order_field, 'title')
+
+    def test_paginate_by_parameter(self):
+        response = self.client.get('/bookfilter/?paginate_by=3&page=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['paginator'].per_page, 3)
+        self.assertEqual([cells[0] for obj, cells in response.context['rows']], ['Book 4'])
+
+        self.assertEqual(self.client.get('/book/list/?paginate_by=3&page=2').status_code, 200)
+        self.assertEqual(self.get_view('/bookfilter/?paginate_by=many').list_state.paginate_by, None)
+        self.assertEqual(self.get_view('/bookfilter/?paginate_by=0', paginate_by=2).list_state.paginate_by, 2)
+
+    def test_keyset_pagination(self):
+        initkwargs = {'keyset_pagination': True, 'paginate_by': 3, 'order_fields': ['title']}
+        view = self.get_view('/bookfilter/?order_by=title&sort=DESC', **initkwargs)
+        paginator, page, object_list, is_paginated = view.paginate_queryset(view.get_queryset(), 3)
+        self.assertEqual([book.title for book in object_list], ['Book 4', 'Book 3', 'Book 2'])
+        self.assertTrue(is_paginated)
+        self.assertFalse(page.has_previous())
+
+        view = self.get_view('/bookfilter/?order_by=title&sort=DESC&cursor={}'.format(page.next_cursor), **initkwargs)
+        paginator, page, object_list, is_paginated = view.paginate_queryset(view.get_queryset(), 3)
+        self.assertEqual([book.title for book in object_list], ['Book 1'])
+        self.assertFalse(page.has_next())
+
+        view = self.get_view('/bookfilter/?order_by=title&sort=DESC&cursor={}'.format(page.previous_cursor),
+                             **initkwargs)
+        paginator, page, object_list, is_paginated = view.paginate_queryset(view.get_queryset(), 3)
+        self.assertEqual([book.title for book in object_list], ['Book 4', 'Book 3', 'Book 2'])
+        self.assertTrue(page.has_next())
+
+    def test_keyset_pagination_threshold(self):
+        view = self.get_view(keyset_pagination=True, keyset_threshold=10)
+        self.assertFalse(view.use_keyset_pagination(view.get_queryset()))
+
+        view = self.get_view(keyset_pagination=True, keyset_threshold=3)
+        self.assertTrue(view.use_keyset_pagination(view.get_queryset()))
+
+    def test_keyset_pagination_render(self):
+        class KeysetBookList(BookFilterList):
+            keyset_pagination = True
+
+        response = KeysetBookList.as_view()(self.factory.get('/bookfilter/?paginate_by=2')).render()
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'paginator_next_id')
+        self.assertNotContains(response, 'total items')
+
+    def test_distinct_only_for_multi_valued_paths(self):
+        view = self.get_view('/bookfilter/?search_phrase=Book')
+        self.assertFalse(view.needs_distinct())
+        self.assertNotIn('DISTINCT', str(view.get_queryset().query))
+
+        class AuthorList(DynamicListView):
+            model = Author
+            field_names = ['name']
+            search_fields = ['name', 'book__title']
+
+        view = AuthorList()
+        view.request = self.factory.get('/authors/?search_phrase=Book')
+        view.kwargs = {}
+        view.list_state = view.get_list_state()
+        self.assertTrue(view.needs_distinct())
+        queryset = view.get_queryset()
+        self.assertNotIn('DISTINCT', str(queryset.query))
+        self.assertEqual(sorted(author.name for author in queryset), ['Ann', 'Joe'])
+
+    def test_rows(self):
+        class ConvertedBookList(BookFilterList):
+            field_names = ['title', 'author__name', 'pages']
+            convert_field_values = {'pages': 'convert_pages', 'title': 'unknown_method'}
+
+            def convert_pages(self, value):
+                return '{} pages'.format(value)
+
+        view = ConvertedBookList(order_fields=['title'])
+        view.request = self.factory.get('/bookfilter/?order_by=title')
+        view.kwargs = {}
+        view.list_state = view.get_list_state()
+        with self.assertNumQueries(1):
+            rows = view.get_rows(view.get_queryset())
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0][1], ['', 'Joe', '100 pages'])
+
+    def test_rows_render(self):
+        response = self.client.get('/book/list/')
+        self.assertContains(response, '<td>Book 1</td>', html=True)
+        self.assertContains(response, 'id="btn_read_', count=4)
+
+    def test_row_links(self):
+        book = Book.objects.get(title='Book 1')
+        view = AdminDynamicListView(model=Book, links=['read', 'update', 'delete'], read_link='book_read',
+                                    update_link='book_update')
+
+        view.request = self.factory.get('/book/list/')
+
+        with mock.patch('django_dynamic_views.links.reverse', wraps=reverse) as patched_reverse:
+            rows = view.add_row_links([(book, []), ({'pk': 'a-b'}, [])])
+        self.assertEqual(patched_reverse.call_count, 2)
+
+        self.assertEqual(rows[0][2], [('read', reverse('book_read', args=[book.pk])),
+                                      ('update', reverse('book_update', args=[book.pk])), ('delete', None)])
+        self.assertEqual(rows[1][2][0], ('read', '/book/read/a-b/'))
+
+        response = self.client.get('/book/list/')
+        self.assertContains(response, 'href="/book/update/{}/"'.format(book.pk))
+
+    def test_projection_rows(self):
+        view = self.get_view('/bookfilter/', projection=True, field_names=['title', 'author__name', 'pages'])
+        with self.assertNumQueries(1):
+            rows = view.get_rows(view.get_queryset().order_by('title'))
+
+        obj, cells = rows[0]
+        self.assertIsInstance(obj, dict)
+        self.assertEqual(cells, ['Book 1', 'Joe', 100])
+        self.assertEqual(obj['author__name'], 'Joe')
+        self.assertEqual(obj['pk'], Book.objects.get(title='Book 1').pk)
+
+    def test_projection_falls_back_to_instances(self):
+        view = self.get_view('/bookfilter/', projection=True)
+        self.assertIsNone(view.get_projection(view.get_queryset()))
+
+        obj, cells = view.get_rows(view.get_queryset().order_by('title'))[0]
+        self.assertIsInstance(obj, Book)
+        self.assertEqual(cells[2], self.author_a)
+
+    def test_projection_render(self):
+        class ProjectedBookList(BookFilterList):
+            projection = True
+            field_names = ['title', 'author__name']
+
+        response = ProjectedBookList.as_view()(self.factory.get('/bookfilter/'))
+        response.render()
+        self.assertContains(response, '<td>Book 1</td>', html=True)
+
+    def test_export_csv(self):
+        response = self.client.get('/book/export/?search_phrase=Book')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'title,description,author,genre,pages')
+        self.assertEqual(len(lines), 5)
+
+    def test_export_csv_non_ascii(self):
+        Book.objects.create(author=self.author_a, genre=self.genre_a, title=u'Café', pages=10)
+        response = self.client.get('/book/export/')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertIn(u'Café,,Joe,SciFy,10', lines)
+
+    def test_export_jsonl(self):
+        view = self.get_view('/bookfilter/?export=jsonl&order_by=title&filter-author__pk={}'.format(self.author_b.pk),
+                             export_formats=['jsonl'], field_names=['title', 'author__name'], order_fields=['title'])
+        response = view.get(view.request)
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(lines, ['{"title": "Book 3", "author__name": "Ann"}',
+                                 '{"title": "Book 4", "author__name": "Ann"}'])
+
+    def test_export_chunks(self):
+        initkwargs = {'export_formats': ['jsonl'], 'export_chunk_size': 2, 'field_names': ['title', 'author__name'],
+                      'order_fields': ['title', 'author__name']}
+
+        view = self.get_view('/bookfilter/?export=jsonl&order_by=title&sort=DESC', **initkwargs)
+        self.assertTrue(view.use_export_chunks(view.get_queryset()))
+        with self.assertNumQueries(3):
+            rows = list(view.get_export_rows(view.get_queryset()))
+        self.assertEqual([title for title, name in rows], ['Book 4', 'Book 3', 'Book 2', 'Book 1'])
+
+        view = self.get_view('/bookfilter/', **dict(initkwargs, field_names=['title', 'author']))
+        with self.assertNumQueries(3):
+            rows = list(view.get_export_rows(view.get_queryset()))
+        self.assertEqual([title for title, author in rows], ['Book 1', 'Book 2', 'Book 3', 'Book 4'])
+
+        # A related column can't be seeked, it is read with one iterator()
+        view = self.get_view('/bookfilter/?order_by=author__name', **initkwargs)
+        self.assertFalse(view.use_export_chunks(view.get_queryset()))
+        self.assertEqual(len(list(view.get_export_rows(view.get_queryset()))), 4)
+
+    def test_export_disabled_by_default(self):
+        response = self.client.get('/bookfilter/?export=csv')
+        self.assertFalse(response.streaming)
+        self.assertContains(self.client.get('/book/list/'), 'id="btn_export"')
+
+    def test_ajax_json(self):
+        class JSONBookList(BookFilterList):
+            ajax_json = True
+            paginate_by = 3
+            order_fields = ['title']
+
+        request = self.factory.get('/bookfilter/?order_by=title&sort=DESC&filter_values=1',
+                                   HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        with self.assertNumQueries(4):
+            response = JSONBookList.as_view()(request)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        data = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(data['fields'][0], {'name': 'title', 'verbose_name': 'title'})
+        self.assertEqual(data['rows'][0]['cells'][:3], ['Book 4', '', 'Ann'])
+        self.assertEqual(data['pagination']['count'], 4)
+        self.assertEqual(data['pagination']['num_pages'], 2)
+        self.assertEqual((data['order_by'], data['sort']), ('title', 'DESC'))
+        self.assertEqual(data['filter_values'][0]['values'], [[self.author_b.pk, 'Ann'], [self.author_a.pk, 'Joe']])
+
+        response = JSONBookList.as_view()(self.factory.get('/bookfilter/'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response['Content-Type'].startswith('application/json'))
+
+    def test_lazy_filter_values(self):
+        view = self.get_view('/bookfilter/?filter-author__pk={}'.format(self.author_b.pk), filter_lazy=['author__pk'])
+        with self.assertNumQueries(2):
+            filter_values = view.get_filter_values()
+
+        self.assertEqual(filter_values[0], ('author__pk', 'Author name', [], 'Ann'))
+        self.assertEqual(filter_values[1][2], [(self.genre_b.pk, 'Drama'), (self.genre_a.pk, 'SciFy')])
+
+    def test_lazy_filter_options(self):
+        response = self.client.get('/book/filter-options/?filter_options=author__pk&term=j')
+        data = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(data['options'], [[self.author_a.pk, 'Joe']])
+
+        view = self.get_view('/bookfilter/?filter_options=author__pk', filter_lazy=True, filter_options_limit=1)
+        data = json.loads(view.get(view.request).content.decode('utf-8'))
+        self.assertEqual(data['options'], [[self.author_b.pk, 'Ann']])
+
+        self.assertEqual(self.client.get('/book/filter-options/?filter_options=title').status_code, 404)
+
+        response = self.client.get('/book/list/')
+        self.assertContains(response, 'data-url="/book/filter-options/"')
+        self.assertNotContains(response, '?filter-author__pk={}"'.format(self.author_a.pk))
+
+    def test_query_runner(self):
+        class RecordingRunner(SequentialRunner):
+            runs = []
+
+            def run(self, queries):
+                self.runs.append(list(queries))
+                return super(RecordingRunner, self).run(queries)
+
+        class RunnerBookList(BookFilterList):
+            query_runner = RecordingRunner()
+            paginate_by = 3
+
+        with self.assertNumQueries(4):
+            response = RunnerBookList.as_view()(self.factory.get('/bookfilter/?page=2'))
+        self.assertEqual(RecordingRunner.runs[0], ['count', 'rows', 'filter-author__pk', 'filter-genre__pk'])
+        self.assertEqual([cells[0] for obj, cells in response.context_data['rows']], ['Book 4'])
+        self.assertEqual(response.context_data['page_obj'].number, 2)
+        self.assertEqual(len(response.context_data['filter_values'][0][2]), 2)
+
+        response = RunnerBookList.as_view()(self.factory.get('/bookfilter/?page=last'))
+        self.assertEqual(response.context_data['page_obj'].number, 2)
+
+        with self.assertRaises(Http404):
+            RunnerBookList.as_view()(self.factory.get('/bookfilter/?page=3'))
+
+
+class TestDynamicDeleteView(TestCase):
+
+    def setUp(self):
+        self.author = Author.objects.create(name='Joe')
+        genre = Genre.objects.create(name='SciFy')
+        for index in range(5):
+            Book.objects.create(author=self.author, genre=genre, title='Book {}'.format(index), pages=100)
+        Book.objects.create(author=Author.objects.create(name='Ann'), genre=genre, title='Other', pages=100)
+
+    def test_delete_counts(self):
+        response = self.client.get('/author/delete/{}/'.format(self.author.pk))
+        self.assertEqual(response.status_code, 200)
+
+        counts = response.context['to_delete_counts']
+        self.assertEqual([(name, count, len(samples)) for name, count, samples in counts],
+                         [('Author', 1, 1), ('Book', 5, 5)])
+
+    def test_delete_counts_multi_table_inheritance(self):
+        ebook = Ebook.objects.create(author=self.author, genre=Genre.objects.first(), title='Ebook', pages=10)
+        counter = DeleteCounter('default')
+
+        counts = [(model, count) for model, count, samples in counter.count(self.author)]
+        self.assertEqual(counts, [(Author, 1), (Book, 6), (Ebook, 1)])
+
+        counts = [(model, count) for model, count, samples in counter.count(ebook.book_ptr)]
+        self.assertEqual(counts, [(Book, 1), (Ebook, 1)])
+
+        counts = [(model, count) for model, count, samples in counter.count(ebook)]
+        self.assertEqual(counts, [(Ebook, 1), (Book, 1)])
+
+    def test_delete_counts_sample_size(self):
+        view = DynamicDeleteView(model=Author, delete_sample_size=2)
+        view.object = self.author
+
+        # A count and sample per model with items, a count for the (empty) Ebook children
+        with self.assertNumQueries(5):
+            counts = view.get_delete_counts()
+        self.assertEqual(counts[1][:2], (Book, 5))
+        self.assertEqual(len(counts[1][2]), 2)
+
+
+class TestBulkActions(TestCase):
+
+    def setUp(self):
+        self.author_a = Author.objects.create(name='Joe')
+        self.author_b = Author.objects.create(name='Ann')
+        self.genre_a = Genre.objects.create(name='SciFy')
+        self.genre_b = Genre.objects.create(name='Drama')
+        for index in range(5):
+            Book.objects.create(author=self.author_a, genre=self.genre_a, title='Book {}'.format(index), pages=100)
+        Book.objects.create(author=self.author_b, genre=self.genre_a, title='Other', pages=100)
+
+    def test_bulk_delete_selected(self):
+        pks = list(Book.objects.filter(author=self.author_a).values_list('pk', flat=True)[:2])
+        response = self.client.post('/book/list/', {'bulk_action': 'delete', 'pk': pks})
+        self.assertRedirects(response, '/book/list/', fetch_redirect_response=False)
+        self.assertEqual(Book.objects.count(), 4)
+        self.assertFalse(Book.objects.filter(pk__in=pks).exists())
+
+    def test_bulk_update_across_filtered_list(self):
+        response = self.client.post('/book/list/?filter-author__pk={}'.format(self.author_a.pk),
+                                    {'bulk_action': 'update', 'select_across': '1',
+                                     'bulk_field': 'genre', 'bulk_value': self.genre_b.pk})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Book.objects.filter(genre=self.genre_b).count(), 5)
+        self.assertEqual(Book.objects.get(title='Other').genre, self.genre_a)
+
+    def test_bulk_chunks(self):
+        view = AdminDynamicListView(model=Book, bulk_actions=['update'], bulk_chunk_size=2)
+        view.request = RequestFactory().post('/book/list/', {'select_across': '1'})
+        view.list_state = view.get_list_state()
+
+        self.assertEqual(view.bulk_update(view.get_bulk_queryset(), {'pages': 50}), 6)
+        self.assertEqual([list(chunk) for chunk in view.get_bulk_chunks(Book.objects.all())][-1], [])
+        self.assertEqual(len(list(view.get_bulk_chunks(Book.objects.all()))), 4)
+        self.assertFalse(Book.objects.exclude(pages=50).exists())
+
+    def test_bulk_invalid(self):
+        self.assertEqual(self.client.post('/book/list/', {'bulk_action': 'drop'}).status_code, 400)
+        response = self.client.post('/book/list/', {'bulk_action': 'update', 'select_across': '1',
+                                                    'bulk_field': 'pages', 'bulk_value': 'many'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/book/list/', {'bulk_action': 'update', 'select_across': '1',
+                                                    'bulk_field': 'title', 'bulk_value': 'x'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.post('/bookfilter/', {'bulk_action': 'delete'}).status_code, 405)
+        response = self.client.post('/book/list/', {'bulk_action': 'delete', 'pk': [Book.objects.first().pk, 'x']})
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn(PRIMARY_COOKIE, response.cookies)
+        self.assertEqual(Book.objects.filter(pages=100).count(), 6)
+
+    def test_bulk_actions_only_on_list(self):
+        for url in ['/book/export/', '/book/filter-options/']:
+            response = self.client.post(url, {'bulk_action': 'delete', 'select_across': '1'})
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(Book.objects.count(), 6)
+
+    def test_bulk_render(self):
+        response = self.client.get('/book/list/')
+        self.assertContains(response, 'id="bulk_form"')
+        self.assertContains(response, 'name="pk"', count=5)
+
+
+class TestDynamicCRUDView(TestCase):
+
+    def test_views_are_built_once(self):
+        self.assertIs(BookCRUD().list_class, BookCRUD().list_class)
+        self.assertIs(BookCRUD().get_view_configs(), BookCRUD().get_view_configs())
+        self.assertEqual(list(BookCRUD().get_view_configs()),
+                         ['list', 'create', 'read', 'update', 'export', 'import', 'filter_options'])
+        self.assertEqual([pattern.name for pattern in BookCRUD().urls()],
+                         ['book_{}'.format(link) for link in BookCRUD().get_view_configs()])
+        self.assertIsNot(BookCRUD().urls(), BookCRUD().urls())
+
+    def test_registry(self):
+        self.assertIn(Book, registry.models)
+        self.assertEqual(registry.get_for_model(Book), [BookCRUD])
+        self.assertEqual(registry.get_for_model(AuthorCRUD.model), [AuthorCRUD])
+
+        class OtherGenreCRUD(DynamicCRUDView):
+            model = Genre
+
+        self.addCleanup(registry.unregister, OtherGenreCRUD)
+        self.assertIn(OtherGenreCRUD, registry.get_for_model(Genre))
+        registry.unregister(OtherGenreCRUD)
+        self.assertNotIn(OtherGenreCRUD, registry.get_for_model(Genre))
+
+    def test_invalid_view_kwargs_raise_when_views_are_built(self):
+        class InvalidCRUD(DynamicCRUDView):
+            model = Genre
+            read_kwargs_regexp = 'x'
+
+            def get_read_view_kwargs(self):
+                return {'model': Genre, 'unknown': True}
+
+        self.addCleanup(registry.unregister, InvalidCRUD)
+        self.assertIn(InvalidCRUD, registry.get_for_model(Genre))
+        self.assertNotIn('_view_configs', InvalidCRUD.__dict__)
+        with self.assertRaises(TypeError):
+            InvalidCRUD().urls()
+        self.assertEqual([error.id for error in check_dynamic_views()], ['django_dynamic_views.E004'])
+
+    def test_overridden_class_property(self):
+        class CustomListCRUD(DynamicCRUDView):
+            model = Genre
+            links = ['list']
+
+            @property
+            def list_class(self):
+                return DynamicListView.as_view(model=Genre, field_names=['name'])
+
+        self.addCleanup(registry.unregister, CustomListCRUD)
+        self.assertEqual(CustomListCRUD().list_class.view_class, DynamicListView)
+        self.assertNotIn('_view_configs', DynamicCRUDView.__dict__)
+        with self.assertRaises(ImproperlyConfigured):
+            DynamicCRUDView().urls()